@@ -124,6 +124,10 @@ class HTML5Engine:
             # Store the URL immediately to avoid it getting lost
             self.base_url = url
             
+            # Cached images are keyed by source, which may be relative to the old page
+            if self.renderer and hasattr(self.renderer, 'invalidate_images'):
+                self.renderer.invalidate_images()
+            
             # Handle special URL schemes
             if url.startswith("about:"):
                 return self._handle_about_url(url)
@@ -818,24 +818,18 @@ class LayoutEngine:
             
         layout_box = LayoutBox(element, display_type, parent_box)
         
-        # Recursively add children
+        # Recursively add children. Text nodes don't get boxes of their own:
+        # their text is part of the parent's content, which the element's
+        # text_content getter joins in a single pass. Writing it back here
+        # would re-copy the text per node, and the text_content setter
+        # replaces all of the element's children.
         if hasattr(element, 'child_nodes'):
             for child in element.child_nodes:
                 # Skip non-element nodes for now (like text, comments, etc.)
                 if hasattr(child, 'node_type') and child.node_type == 1:  # ELEMENT_NODE
                     child_box = self._build_layout_tree(child, layout_box)
                     layout_box.add_child(child_box)
-                elif hasattr(child, 'node_type') and child.node_type == 3:  # TEXT_NODE
-                    # Handle text nodes specially
-                    # In a real browser, we would create anonymous boxes for text
-                    # For simplicity, we'll just include the text in the parent's content
-                    if hasattr(element, 'text_content'):
-                        if hasattr(child, 'node_value'):
-                            if not element.text_content:
-                                element.text_content = child.node_value
-                            else:
-                                element.text_content += child.node_value
-                        
+
         return layout_box
     
     def _create_layout_box(self, element: Element) -> LayoutBox:
@@ -312,6 +312,9 @@ class Element(Node):
             self._update_class_list()
         elif name == 'style':
             self._style = self._parse_style_attribute(value)
+        elif name == 'id':
+            # Drop the renderer's cached canvas tag for this element
+            self.__dict__.pop('_render_tag_cache', None)
         elif name.startswith('data-'):
             self._update_dataset()
     
@@ -334,6 +337,8 @@ class Element(Node):
             self._update_class_list()
         elif attr.name == 'style':
             self._style = self._parse_style_attribute(attr.value)
+        elif attr.name == 'id':
+            self.__dict__.pop('_render_tag_cache', None)
         elif attr.name.startswith('data-'):
             self._update_dataset()
         
@@ -355,6 +360,8 @@ class Element(Node):
                 self._class_list.clear()
             elif name == 'style':
                 self._style.clear()
+            elif name == 'id':
+                self.__dict__.pop('_render_tag_cache', None)
             elif name.startswith('data-'):
                 self._update_dataset()
     
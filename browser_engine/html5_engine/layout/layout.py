@@ -1,5 +1,6 @@
 import re
 import math
+from itertools import accumulate
 from typing import Dict, List, Optional, Tuple, Union
 
 from .box_metrics import BoxMetrics
@@ -921,9 +922,7 @@ class LayoutBox:
             # Calculate available space for flexible items
             available_space = max(0, child_container_width - total_fixed_width)
             
-            # Second pass: adjust sizes and positions based on flex properties
-            current_x = content_x
-            
+            # Second pass: adjust sizes based on flex properties
             for child in self.children:
                 # Adjust width for flexible items
                 if 'flex-grow' in child.computed_style and total_flex_grow > 0:
@@ -933,12 +932,11 @@ class LayoutBox:
                     if child.box_metrics.content_width == 'auto':
                         child.box_metrics.content_width = flex_width
                         child._update_box_dimensions()
-                
-                # Position child
-                child.box_metrics.x = current_x
-                
-                # Move to next position
-                current_x += child.box_metrics.margin_box_width
+            
+            # Position children from a running sum of the margin box widths
+            widths = [child.box_metrics.margin_box_width for child in self.children]
+            for child, x in zip(self.children, accumulate(widths, initial=content_x)):
+                child.box_metrics.x = x
         
         elif flex_direction == 'column':
             # Similar logic for column layout
@@ -960,16 +958,12 @@ class LayoutBox:
             # For now, we don't know the container height, so we can't calculate available space accurately
             # In a real implementation, we would need to handle this better
             
-            # Second pass: just position children
-            current_y = content_y
-            
-            for child in self.children:
-                # Position child
+            # Second pass: just position children, stacking them from a
+            # running sum of the margin box heights
+            heights = [child.box_metrics.margin_box_height for child in self.children]
+            for child, y in zip(self.children, accumulate(heights, initial=content_y)):
                 child.box_metrics.x = content_x
-                child.box_metrics.y = current_y
-                
-                # Move to next position
-                current_y += child.box_metrics.margin_box_height 
+                child.box_metrics.y = y
 
 class LayoutEngine:
     """
@@ -13,11 +13,14 @@ from PIL import Image, ImageTk, ImageDraw, ImageFont
 import math
 import threading
 import queue
+import requests
 import urllib.request
 import urllib.parse
 import urllib.error
 import base64
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
 from browser_engine.html5_engine.dom import element
@@ -25,6 +28,15 @@ from browser_engine.html5_engine.dom import element
 from ..dom import Document, Element, Node, NodeType
 from ..css import LayoutEngine, LayoutBox, CSSParser, DisplayType, BoxType
 
+# NumPy is used to run geometry queries over all layout boxes at once
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+    logging.warning("numpy not available. Box geometry queries will be slower.")
+
 logger = logging.getLogger(__name__)
 
 # Dictionary of named colors to their hex values
@@ -178,6 +190,45 @@ NAMED_COLORS = {
     'yellowgreen': '#9acd32'
 }
 
+class _LRUCache(OrderedDict):
+    """
+    Dictionary that holds at most maxsize entries, evicting the least recently used.
+    
+    Image caches are filled from the background loader threads, so updates
+    are made under a lock.
+    """
+    
+    def __init__(self, maxsize: int):
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of entries to keep
+        """
+        super().__init__()
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+    
+    def __getitem__(self, key):
+        with self._lock:
+            value = super().__getitem__(key)
+            self.move_to_end(key)
+            return value
+    
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            while len(self) > self.maxsize:
+                self.popitem(last=False)
+
+
 class HTML5Renderer:
     """
     HTML5 Renderer using Tkinter.
@@ -185,6 +236,82 @@ class HTML5Renderer:
     This class renders HTML5 documents with full CSS support.
     """
     
+    # Cell size in pixels of the hit testing grid
+    HIT_GRID_SIZE = 128
+    
+    # Delay in milliseconds before re-rendering after the last resize event
+    RESIZE_DEBOUNCE_MS = 50
+    
+    # Interval in milliseconds for collecting images decoded in the background
+    IMAGE_POLL_MS = 16
+    
+    # Extra distance in pixels painted beyond each edge of the visible area
+    CULL_MARGIN = 600
+    
+    # Maximum number of decoded images (and their PhotoImages) kept in memory
+    IMAGE_CACHE_SIZE = 256
+    
+    # Zoom limits and the step used by zoom_in/zoom_out
+    ZOOM_MIN = 0.5
+    ZOOM_MAX = 3.0
+    ZOOM_STEP = 0.1
+    
+    # Tags grouped by how their content is rendered
+    HEADING_TAGS = frozenset({'h1', 'h2', 'h3', 'h4', 'h5', 'h6'})
+    FORM_TAGS = frozenset({'input', 'button', 'textarea', 'select'})
+    BLOCK_TAGS = frozenset({'div', 'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'ul', 'ol', 'table'})
+    TEXT_CONTAINER_TAGS = frozenset({'p', 'div', 'span', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li'})
+    INLINE_TAGS = frozenset({'span', 'em', 'strong', 'b', 'i', 'u', 'code', 'small', 'big', 'sub', 'sup'})
+    TEXT_BREAK_TAGS = frozenset({'div', 'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+                                 'ul', 'ol', 'li', 'table', 'tr', 'blockquote'})
+    NON_RENDERED_TAGS = frozenset({'script', 'style'})
+    
+    # background-color values that paint nothing
+    TRANSPARENT_BACKGROUNDS = frozenset({'transparent', 'inherit', 'initial', 'unset', 'none',
+                                         'rgba(0,0,0,0)', 'rgba(0, 0, 0, 0)'})
+    TRANSPARENT_RGBA_RE = re.compile(r'rgba\(\s*[\d.]+\s*,\s*[\d.]+\s*,\s*[\d.]+\s*,\s*(?:0+\.?0*|\.0+)\s*\)$')
+    
+    # <input> types grouped by how they are drawn
+    TEXT_INPUT_TYPES = frozenset({None, 'text', 'password', 'email', 'number', 'search', 'tel', 'url'})
+    BUTTON_INPUT_TYPES = frozenset({'button', 'submit', 'reset'})
+    
+    # Tcl procedure creating many canvas items in a single call from Python.
+    # Arguments after the canvas are (type, coords, options) triples; it
+    # returns the new item ids, with an empty id for items Tk rejected.
+    BATCH_CREATE_PROC = """
+proc ::wink_create_items {canvas args} {
+    set ids {}
+    foreach {type coords opts} $args {
+        if {[catch {$canvas create $type {*}$coords {*}$opts} id]} {
+            set id {}
+        }
+        lappend ids $id
+    }
+    return $ids
+}
+"""
+    
+    # Style properties that decide how a box's background and border are painted
+    PAINT_PROPERTIES = (
+        'background-color',
+        'border-top-width', 'border-right-width', 'border-bottom-width', 'border-left-width',
+        'border-top-style', 'border-right-style', 'border-bottom-style', 'border-left-style',
+        'border-top-color', 'border-right-color', 'border-bottom-color', 'border-left-color',
+    )
+    
+    # Button (background, text, border) colors, keyed by disabled state
+    BUTTON_COLORS = {
+        False: ('#f0f0f0', '#000000', '#c0c0c0'),
+        True: ('#e0e0e0', '#a0a0a0', '#c0c0c0'),
+    }
+    
+    # CSS text-align values mapped to the justify option of canvas text items
+    TEXT_ALIGN_JUSTIFY = {
+        'left': 'left', 'start': 'left', 'justify': 'left',
+        'center': 'center',
+        'right': 'right', 'end': 'right',
+    }
+    
     def __init__(self, parent: ttk.Frame):
         """
         Initialize the renderer.
@@ -208,8 +335,8 @@ class HTML5Renderer:
         # Create the canvas for rendering
         self.canvas = tk.Canvas(
             self.main_frame,
-            yscrollcommand=self.v_scrollbar.set,
-            xscrollcommand=self.h_scrollbar.set,
+            yscrollcommand=self._on_canvas_yscroll,
+            xscrollcommand=self._on_canvas_xscroll,
             bg='#f5f5f5'  # Light gray background instead of white
         )
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -218,6 +345,9 @@ class HTML5Renderer:
         self.v_scrollbar.config(command=self.canvas.yview)
         self.h_scrollbar.config(command=self.canvas.xview)
         
+        # Tcl helper that creates a batch of queued canvas items in one call
+        self.canvas.tk.eval(self.BATCH_CREATE_PROC)
+        
         # Layout and CSS engines
         self.layout_engine = LayoutEngine()
         self.css_parser = CSSParser()
@@ -238,12 +368,58 @@ class HTML5Renderer:
         # Canvas items (for cleanup)
         self.canvas_items: List[int] = []
         
+        # Deferred draw operations (backgrounds, borders, rules) collected
+        # during the tree walk and created in a single pass afterwards
+        self._pending_ops: List[Tuple[str, Tuple, Dict[str, Any], Optional[int]]] = []
+        
+        # Set while a render pass is running to ignore re-entrant resizes
+        self._rendering = False
+        
         # Viewport dimensions
         self.viewport_width = 800
         self.viewport_height = 600
         
-        # Zoom level (1.0 = 100%)
+        # Debounced resize handling
+        self._pending_resize_id: Optional[str] = None
+        self._resize_size: Tuple[int, int] = (self.viewport_width, self.viewport_height)
+        self._last_render_size: Optional[Tuple[int, int]] = None
+        
+        # Set while a debounced resize re-renders the current document, whose
+        # scripts already ran when it was first rendered
+        self._resize_render = False
+        
+        # Viewport culling: the canvas region the last pass painted (with a
+        # margin) and the ids of the layout boxes inside it. None means
+        # everything was painted.
+        self._cull_rect: Optional[Tuple[float, float, float, float]] = None
+        self._visible_boxes: Optional[Set[int]] = None
+        self._pending_cull_id: Optional[str] = None
+        
+        # Geometry of every layout box in the current tree, stored as parallel
+        # arrays (x, y, width, height) in the same order as _geometry_boxes
+        self._geometry_boxes: List[LayoutBox] = []
+        self._bx = self._by = self._bw = self._bh = []
+        
+        # Text of each box's element when the geometry was collected, so a
+        # re-render of the same document can tell whether any text changed
+        self._box_texts: List[str] = []
+        
+        # Canvas items drawn for each element (keyed by id() of the element)
+        # in the last pass, so a re-render of the same document can move them
+        # instead of deleting and recreating them
+        self._items_by_element: Dict[int, List[int]] = {}
+        self._painting_key: Optional[int] = None
+        self._rendered_document: Optional[Document] = None
+        
+        # Uniform grid of rendered element boxes for hit testing, keyed by
+        # (x // HIT_GRID_SIZE, y // HIT_GRID_SIZE)
+        self._hit_grid: Dict[Tuple[int, int], List[Tuple[float, float, float, float, Element]]] = {}
+        self._hit_rects: List[Tuple[float, float, float, float, Element]] = []
+        
+        # Zoom level (1.0 = 100%), and the zoom the canvas items are
+        # currently scaled to
         self.zoom_level = 1.0
+        self._applied_zoom = 1.0
         
         # Fonts
         self._init_fonts()
@@ -251,9 +427,30 @@ class HTML5Renderer:
         # Colors
         self._init_colors()
         
-        # Image caches
-        self.image_cache: Dict[str, Image.Image] = {}  # PIL Image cache
-        self.photo_cache: Dict[str, PhotoImage] = {}  # Tkinter PhotoImage cache
+        # Image caches, kept across renders and emptied by invalidate_images().
+        # Resized images and PhotoImages are keyed by (src, width, height).
+        self.image_cache: Dict[str, Image.Image] = _LRUCache(self.IMAGE_CACHE_SIZE)  # PIL Image cache
+        self._sized_image_cache: Dict[Tuple[str, int, int], Image.Image] = _LRUCache(self.IMAGE_CACHE_SIZE)
+        self.photo_cache: Dict[Tuple[str, int, int], PhotoImage] = _LRUCache(self.IMAGE_CACHE_SIZE)  # Tkinter PhotoImage cache
+        
+        # Background image loading: workers fetch, decode and resize images
+        # and post (src, size, image) results to a queue drained on the Tk
+        # thread. size is None for the decoded original.
+        self._img_executor = ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 1) + 4),
+            thread_name_prefix='image-loader'
+        )
+        self._img_queue: 'queue.Queue[Tuple[str, Optional[Tuple[int, int]], Optional[Image.Image]]]' = queue.Queue()
+        self._img_loading: Set[Union[str, Tuple[str, int, int]]] = set()
+        self._img_poll_id: Optional[str] = None
+        
+        # Image boxes drawn as placeholders, waiting for their image to load:
+        # src -> [(layout_box, x, y, width, height, placeholder item ids)]
+        self._pending_image_boxes: Dict[str, List[Tuple[LayoutBox, int, int, int, int, List[int]]]] = {}
+        
+        # Image items on the canvas: item id -> (layout_box, x, y, width,
+        # height), so zooming can redraw them at the new size
+        self._image_items: Dict[int, Tuple[LayoutBox, int, int, int, int]] = {}
         
         # Network manager (will be set by set_engine)
         self.network_manager = None
@@ -270,11 +467,29 @@ class HTML5Renderer:
         # Event bindings
         self._init_event_bindings()
         
+        # Content renderers for tags that bypass the generic text path,
+        # all called as handler(layout_box, x, y, width, height)
+        self._content_dispatch: Dict[str, Callable] = {'img': self._render_image}
+        for tag in self.FORM_TAGS:
+            self._content_dispatch[tag] = self._render_form_element
+        for tag in self.HEADING_TAGS:
+            self._content_dispatch[tag] = lambda layout_box, x, y, width, height: self._render_heading_element(layout_box)
+        
         # Link handling callbacks
         self.on_link_click: Optional[Callable[[str], None]] = None
         
         logger.debug("HTML5 Renderer initialized")
         
+        # Resolved background/border paint, keyed by the PAINT_PROPERTIES values
+        self._paint_plan_cache: Dict[tuple, Tuple[Optional[str], Tuple[Tuple[str, int, str], ...]]] = {}
+        
+        # Element text looked up during the current render pass, by id()
+        self._text_cache: Dict[int, str] = {}
+        
+        # (has_links, has_text, has_other_inline) of an element's children
+        # for the current render pass, by id()
+        self._child_summary_cache: Dict[int, Tuple[bool, bool, bool]] = {}
+        
         # Track processed nodes to prevent duplicates
         self.processed_nodes = set()
         self.processed_rendered_paragraphs = set()
@@ -302,6 +517,283 @@ class HTML5Renderer:
             'underline': 'underline',
             'overstrike': 'overstrike'  # For strikethrough
         }
+        
+        # Tk font objects keyed by font tuple, so repeated text draws reuse
+        # the same named font instead of Tk re-parsing the description
+        self._font_cache: Dict[Tuple, tkfont.Font] = {}
+        self._linespace_cache: Dict[Tuple, int] = {}
+        
+        # Widths of the ASCII characters of each font tuple, for line breaking
+        self._char_width_cache: Dict[Tuple, List[int]] = {}
+        
+        # Parsed computed font-size values, keyed by (value, fallback size)
+        self._font_size_cache: Dict[Tuple, int] = {}
+        
+        # Factor applied to the size of every cached font (see _set_font_scale)
+        self._font_scale = 1.0
+    
+    def _parse_font_size(self, value: Any, default: int) -> int:
+        """
+        Convert a computed font-size value to an integer size.
+        
+        Args:
+            value: The font-size value (e.g. '16px', '16' or 16)
+            default: Size to use when the value cannot be parsed
+            
+        Returns:
+            The font size
+        """
+        try:
+            return self._font_size_cache[(value, default)]
+        except KeyError:
+            pass
+        except TypeError:
+            return default  # Unhashable value; not a size we can parse
+        
+        try:
+            if isinstance(value, str) and value.endswith('px'):
+                size = int(value[:-2])
+            else:
+                size = int(value)
+        except (ValueError, TypeError):
+            size = default
+        
+        self._font_size_cache[(value, default)] = size
+        return size
+    
+    def _style_font(self, family: str, size: int, weight: str, style: str) -> Tuple:
+        """
+        Build the font tuple for a family, size, weight and style.
+        
+        Args:
+            family: The font family
+            size: The font size
+            weight: The font weight ('bold' makes the font bold)
+            style: The font style ('italic' makes the font italic)
+            
+        Returns:
+            Font tuple usable with _get_font and canvas text items
+        """
+        bold = weight == 'bold'
+        italic = style == 'italic'
+        if bold and italic:
+            return (family, size, 'bold italic')
+        if bold:
+            return (family, size, 'bold')
+        if italic:
+            return (family, size, 'italic')
+        return (family, size)
+    
+    def _get_font(self, font: Tuple) -> tkfont.Font:
+        """
+        Get a cached Tk font for a font tuple.
+        
+        Args:
+            font: Font tuple of (family, size) or (family, size, styles), where
+                styles is a space separated string such as 'bold italic'
+            
+        Returns:
+            The matching tkinter.font.Font object
+        """
+        cached = self._font_cache.get(font)
+        if cached is not None:
+            return cached
+        
+        family, size = font[0], font[1]
+        styles = font[2].split() if len(font) > 2 and font[2] else ()
+        
+        cached = tkfont.Font(
+            family=family,
+            size=self._scaled_font_size(size),
+            weight='bold' if 'bold' in styles else 'normal',
+            slant='italic' if 'italic' in styles else 'roman',
+            underline='underline' in styles,
+            overstrike='overstrike' in styles
+        )
+        self._font_cache[font] = cached
+        return cached
+    
+    def _scaled_font_size(self, size):
+        """
+        Apply the current font scale to a font size.
+        
+        Args:
+            size: Font size in points (or negative, in pixels)
+            
+        Returns:
+            The scaled size, never rounded down to zero
+        """
+        if self._font_scale == 1.0 or not isinstance(size, (int, float)):
+            return size
+        scaled = round(size * self._font_scale)
+        return scaled or (1 if size > 0 else -1)
+    
+    def _set_font_scale(self, scale: float) -> None:
+        """
+        Resize every cached font to its base size times scale.
+        
+        Canvas text items refer to the cached fonts by name, so they are
+        resized along with them.
+        
+        Args:
+            scale: Factor to apply to the base font sizes
+        """
+        self._font_scale = scale
+        for font, tk_font in self._font_cache.items():
+            tk_font.configure(size=self._scaled_font_size(font[1]))
+        self._linespace_cache.clear()
+        self._char_width_cache.clear()
+    
+    def _char_widths(self, font: Tuple) -> List[int]:
+        """
+        Get the width of each ASCII character in a font, measured once and cached.
+        
+        Args:
+            font: Font tuple as accepted by _get_font
+            
+        Returns:
+            List of 128 widths in pixels, indexed by character code
+        """
+        widths = self._char_width_cache.get(font)
+        if widths is None:
+            measure = self._get_font(font).measure
+            widths = [measure(chr(code)) if code >= 32 else 0 for code in range(128)]
+            self._char_width_cache[font] = widths
+        return widths
+    
+    def _break_words_by_table(self, font: Tuple, words: List[str], first_width: float, max_width: float) -> List[str]:
+        """
+        Greedily break ASCII words into lines using the character width table.
+        
+        Args:
+            font: Font tuple as accepted by _get_font
+            words: The words to break, all ASCII
+            first_width: Space left on the current line
+            max_width: Width of a full line
+            
+        Returns:
+            The lines of text, as described in _break_text
+        """
+        widths = self._char_widths(font)
+        space_width = widths[32]
+        
+        lines = []
+        line = []
+        line_width = 0
+        available = first_width
+        for word in words:
+            word_width = sum([widths[code] for code in word.encode('ascii')])
+            needed = line_width + space_width + word_width if line else word_width
+            
+            # A word wider than a full line gets a line to itself
+            if needed <= available or (not line and available >= max_width):
+                line.append(word)
+                line_width = needed
+                continue
+            
+            if line:
+                lines.append(' '.join(line))
+            else:
+                # Wrap before the first word of a partly filled line
+                lines.append('')
+            line = [word]
+            line_width = word_width
+            available = max_width
+        
+        lines.append(' '.join(line))
+        return lines
+    
+    def _get_linespace(self, font: Tuple) -> int:
+        """
+        Get the line height of a font tuple, measured once and cached.
+        
+        Args:
+            font: Font tuple as accepted by _get_font
+            
+        Returns:
+            Line height in pixels
+        """
+        linespace = self._linespace_cache.get(font)
+        if linespace is None:
+            linespace = self._get_font(font).metrics('linespace')
+            self._linespace_cache[font] = linespace
+        return linespace
+    
+    def _measure_text(self, font: Tuple, text: str) -> Tuple[int, int]:
+        """
+        Measure unwrapped text with a cached font, without a canvas item.
+        
+        Args:
+            font: Font tuple as accepted by _get_font
+            text: The text to measure
+            
+        Returns:
+            Tuple of (width, height) in pixels
+        """
+        tk_font = self._get_font(font)
+        lines = text.split('\n')
+        width = max(tk_font.measure(line) for line in lines)
+        return width, self._get_linespace(font) * len(lines)
+    
+    def _break_text(self, font: Tuple, text: str, first_width: float, max_width: float) -> List[str]:
+        """
+        Break text at spaces into lines that fit the given widths.
+        
+        ASCII text is measured with the font's character width table, so
+        breaking it makes no Tk calls at all. For other text the longest run
+        of words that fits each line is found by binary search over the word
+        count, so a line costs O(log words) measure calls instead of one per
+        word.
+        
+        Args:
+            font: Font tuple as accepted by _get_font
+            text: The text to break
+            first_width: Space left on the current line
+            max_width: Width of a full line
+            
+        Returns:
+            The lines of text. The first is empty if not even one word fits
+            in first_width, meaning the text starts on a new line.
+        """
+        words = text.split()
+        if not words or max_width <= 0:
+            return [text]
+        
+        if text.isascii():
+            return self._break_words_by_table(font, words, first_width, max_width)
+        
+        measure = self._get_font(font).measure
+        lines = []
+        start = 0
+        available = first_width
+        while start < len(words):
+            remaining = len(words) - start
+            if measure(' '.join(words[start:])) <= available:
+                fit = remaining
+            else:
+                # Largest word count that fits; zero always does
+                low, high = 0, remaining - 1
+                while low < high:
+                    mid = (low + high + 1) // 2
+                    if measure(' '.join(words[start:start + mid])) <= available:
+                        low = mid
+                    else:
+                        high = mid - 1
+                fit = low
+            
+            if fit == 0:
+                if available < max_width:
+                    # Wrap before the first word of a partly filled line
+                    lines.append('')
+                    available = max_width
+                    continue
+                fit = 1  # A word wider than the line gets a line to itself
+            
+            lines.append(' '.join(words[start:start + fit]))
+            start += fit
+            available = max_width
+        
+        return lines
     
     def _init_colors(self) -> None:
         """Initialize colors for rendering."""
@@ -322,6 +814,10 @@ class HTML5Renderer:
         
         # Resize event binding
         self.parent.bind("<Configure>", self._on_resize)
+        
+        # Hand cursor over enabled buttons (items tagged 'button')
+        self.canvas.tag_bind('button', '<Enter>', lambda event: self.canvas.config(cursor='hand2'))
+        self.canvas.tag_bind('button', '<Leave>', lambda event: self.canvas.config(cursor=''))
     
     def set_engine(self, engine) -> None:
         """
@@ -331,10 +827,17 @@ class HTML5Renderer:
             engine: The HTML5Engine instance
         """
         self.html5_engine = engine
-        # Get network manager from engine
+        # Get network manager from engine, falling back to the shared one the
+        # engine fetches pages with, so images reuse its pooled connections
+        # instead of opening a new urllib connection per image
         self.network_manager = getattr(engine, 'network_manager', None)
         if not self.network_manager:
-            logger.warning("No network manager available - image loading may be limited")
+            try:
+                # Import here to avoid circular imports
+                from browser_engine.network.network_manager import NetworkManager
+                self.network_manager = NetworkManager()
+            except Exception as e:
+                logger.warning(f"No network manager available - image loading may be limited: {e}")
         logger.debug("HTML5Engine reference set in renderer")
     
     def clear(self) -> None:
@@ -344,11 +847,81 @@ class HTML5Renderer:
         """
         self._clear_canvas()
         self.document = None
+        self._rendered_document = None
         self.layout_tree = None
-        # Clear image caches
+        logger.debug("Renderer cleared")
+    
+    def invalidate_images(self) -> None:
+        """
+        Drop all decoded images.
+        
+        Images are cached by source, which may be relative to the page, so
+        the engine calls this when navigating to a new URL.
+        """
         self.image_cache.clear()
+        self._sized_image_cache.clear()
         self.photo_cache.clear()
-        logger.debug("Renderer cleared")
+        logger.debug("Image caches cleared")
+    
+    def zoom_in(self) -> None:
+        """Increase the zoom level."""
+        self.set_zoom(self.zoom_level + self.ZOOM_STEP)
+    
+    def zoom_out(self) -> None:
+        """Decrease the zoom level."""
+        self.set_zoom(self.zoom_level - self.ZOOM_STEP)
+    
+    def zoom_reset(self) -> None:
+        """Reset zoom to default level."""
+        self.set_zoom(1.0)
+    
+    def set_zoom(self, level: float) -> None:
+        """
+        Set the zoom level and rescale the current page in place.
+        
+        Args:
+            level: Zoom factor (1.0 = 100%), clamped to ZOOM_MIN..ZOOM_MAX
+        """
+        self.zoom_level = round(min(self.ZOOM_MAX, max(self.ZOOM_MIN, level)), 2)
+        self._apply_zoom()
+        logger.debug(f"Zoom: {self.zoom_level:.1f}")
+    
+    def _apply_zoom(self) -> None:
+        """
+        Scale the canvas items from the zoom they were drawn at to zoom_level.
+        
+        Coordinates are scaled with a single canvas.scale call and text grows
+        with its cached fonts. Only images are recreated, from copies resized
+        to the new zoom level.
+        """
+        factor = self.zoom_level / self._applied_zoom
+        if factor == 1.0:
+            return
+        
+        try:
+            self.canvas.scale('all', 0, 0, factor, factor)
+            
+            # Wrapped text keeps wrapping at the same place
+            for item_id in self.canvas.find_withtag('text'):
+                wrap_width = float(self.canvas.itemcget(item_id, 'width') or 0)
+                if wrap_width:
+                    self.canvas.itemconfigure(item_id, width=wrap_width * factor)
+        except TclError as e:
+            logger.error(f"Error applying zoom: {e}")
+            return
+        
+        self._set_font_scale(self.zoom_level)
+        self._applied_zoom = self.zoom_level
+        
+        # A render pass updates these itself once it's done, and draws its
+        # images at zoom_level to begin with
+        if not self._rendering:
+            images = self._image_items
+            self._image_items = {}
+            for item_id, (layout_box, x, y, width, height) in images.items():
+                self._redraw_image_box(layout_box, x, y, width, height, (item_id,))
+            self._update_scroll_region()
+            self._schedule_cull_check()
     
     def _on_canvas_click(self, event) -> None:
         """
@@ -362,8 +935,8 @@ class HTML5Renderer:
         element = self._find_element_at_position(x, y)
         
         if element:
-            # Check for link
-            if element.tag_name.lower() == 'a':
+            # Check for link (skip links drawn with their own click bindings)
+            if element.tag_name.lower() == 'a' and 'link' not in self.canvas.gettags('current'):
                 href = element.get_attribute('href')
                 if href and self.on_link_click:
                     self.on_link_click(href)
@@ -375,13 +948,57 @@ class HTML5Renderer:
         Args:
             event: Tkinter event object
         """
+        # Ignore Configure events triggered by our own drawing
+        if self._rendering:
+            return
+        
+        # Window drags fire many Configure events; only re-render once
+        # they have settled
+        self._resize_size = (event.width, event.height)
+        if self._pending_resize_id is not None:
+            self.parent.after_cancel(self._pending_resize_id)
+        self._pending_resize_id = self.parent.after(self.RESIZE_DEBOUNCE_MS, self._do_resize_render)
+    
+    def _do_resize_render(self) -> None:
+        """Re-render the document after a debounced resize."""
+        self._pending_resize_id = None
+        
         # Update viewport dimensions
-        self.viewport_width = event.width
-        self.viewport_height = event.height
+        width, height = self._resize_size
+        self.viewport_width = width
+        self.viewport_height = height
+        
+        if not self.document:
+            return
+        
+        last_size = self._last_render_size
+        if last_size == (width, height):
+            return
+        
+        # Layout only depends on the viewport width, so a height change just
+        # shows more or less of the current page; paint whatever culling
+        # left out of a taller view
+        if last_size and width == last_size[0] and self.layout_tree:
+            self._last_render_size = (width, height)
+            self._update_scroll_region()
+            self._schedule_cull_check()
+            return
+        
+        # If the page didn't fill the previous viewport, a wider viewport
+        # doesn't change its layout, so only the scroll region needs updating
+        if last_size and height == last_size[1] and width >= last_size[0] and self.layout_tree:
+            content_width = self.layout_tree.box_metrics.width
+            if isinstance(content_width, (int, float)) and content_width < last_size[0]:
+                self._last_render_size = (width, height)
+                self._update_scroll_region()
+                return
         
-        # Re-render the document if available
-        if self.document:
+        # Re-render the document
+        self._resize_render = True
+        try:
             self.render(self.document)
+        finally:
+            self._resize_render = False
     
     def _find_element_at_position(self, x: int, y: int) -> Optional[Element]:
         """
@@ -394,24 +1011,143 @@ class HTML5Renderer:
         Returns:
             The element at the position, or None if not found
         """
-        # Get canvas items at the position
-        items = self.canvas.find_overlapping(x, y, x, y)
-        
-        for item_id in items:
-            # Check if the item has an associated element
-            element_id = self.canvas.itemcget(item_id, 'tags')
-            if element_id and element_id.startswith('element:'):
-                # Extract element ID and find in document
-                id_parts = element_id.split(':')
-                if len(id_parts) >= 2:
-                    element_selector = id_parts[1]
-                    # Find element in document
-                    if self.document:
-                        return self.document.query_selector(f"#{element_selector}")
+        # Hit rects are stored in unzoomed layout coordinates
+        zoom = self._applied_zoom
+        if zoom != 1.0:
+            x, y = x / zoom, y / zoom
+        
+        cell = (int(x // self.HIT_GRID_SIZE), int(y // self.HIT_GRID_SIZE))
+        
+        # Boxes are added in paint order, so the last match is the topmost
+        for x1, y1, x2, y2, element in reversed(self._hit_grid.get(cell, ())):
+            if x1 <= x <= x2 and y1 <= y <= y2:
+                return element
         
         # No element found
         return None
     
+    def _tag_for(self, element) -> str:
+        """
+        Get the canvas tag identifying an element, cached on the element.
+        
+        Args:
+            element: The element to get the tag for
+            
+        Returns:
+            'element:<id>' if the element has an id, otherwise an empty string
+        """
+        try:
+            return element.__dict__['_render_tag_cache']
+        except (KeyError, AttributeError):
+            pass
+        
+        element_id = getattr(element, 'id', None)
+        tag = f'element:{element_id}' if element_id else ''
+        try:
+            element.__dict__['_render_tag_cache'] = tag
+        except AttributeError:
+            pass
+        return tag
+    
+    def _tag_name_of(self, element) -> str:
+        """
+        Get the lower-cased tag name of an element, cached on the element.
+        
+        Args:
+            element: The element to get the tag name for
+            
+        Returns:
+            The lower-cased tag name, or an empty string for nodes without one
+        """
+        try:
+            return element.__dict__['_tag_lower']
+        except (KeyError, AttributeError):
+            pass
+        
+        tag_name = element.tag_name.lower() if hasattr(element, 'tag_name') else ''
+        try:
+            element.__dict__['_tag_lower'] = tag_name
+        except AttributeError:
+            pass
+        return tag_name
+    
+    def _text(self, element) -> str:
+        """
+        Get an element's text content, cached for the current render pass.
+        
+        Args:
+            element: The element to get the text of
+            
+        Returns:
+            The element's text content, or an empty string if it has none
+        """
+        key = id(element)
+        text = self._text_cache.get(key)
+        if text is None:
+            if hasattr(element, 'text_content'):
+                text = element.text_content
+            elif hasattr(element, 'textContent'):
+                text = element.textContent
+            elif hasattr(element, 'text'):
+                text = element.text
+            text = text or ""
+            self._text_cache[key] = text
+        return text
+    
+    def _child_summary(self, element) -> Tuple[bool, bool, bool]:
+        """
+        Summarise an element's children in one pass, cached for the current render pass.
+        
+        Args:
+            element: The element whose children to inspect
+            
+        Returns:
+            Tuple of (has_links, has_text, has_other_inline), where has_text
+            means a non-blank direct text node
+        """
+        key = id(element)
+        summary = self._child_summary_cache.get(key)
+        if summary is None:
+            has_links = has_text = has_other_inline = False
+            tag_name_of = self._tag_name_of
+            inline_tags = self.INLINE_TAGS
+            for child in getattr(element, 'child_nodes', None) or ():
+                tag = tag_name_of(child)
+                if tag == 'a':
+                    has_links = True
+                elif tag:
+                    if tag in inline_tags:
+                        has_other_inline = True
+                elif not has_text and getattr(child, 'node_type', None) == 3:  # Text node
+                    value = getattr(child, 'node_value', None)
+                    if value and value.strip():
+                        has_text = True
+            summary = (has_links, has_text, has_other_inline)
+            self._child_summary_cache[key] = summary
+        return summary
+    
+    def _add_hit_rect(self, x: float, y: float, width: float, height: float, element: Element) -> None:
+        """
+        Register a rendered element box with the hit testing grid.
+        
+        Args:
+            x: X coordinate of the box
+            y: Y coordinate of the box
+            width: Width of the box
+            height: Height of the box
+            element: The element the box was rendered for
+        """
+        if width <= 0 or height <= 0:
+            return
+        
+        entry = (x, y, x + width, y + height, element)
+        self._hit_rects.append(entry)
+        size = self.HIT_GRID_SIZE
+        grid = self._hit_grid
+        for cx in range(int(x // size), int((x + width) // size) + 1):
+            for cy in range(int(y // size), int((y + height) // size) + 1):
+                grid.setdefault((cx, cy), []).append(entry)
+    
     def render(self, document: Document, layout: Optional[LayoutBox] = None) -> None:
         """
         Render the document.
@@ -423,13 +1159,21 @@ class HTML5Renderer:
         logger.info("Rendering document")
         start_time = time.time()
         
+        # Re-rendering the document already on the canvas (e.g. after a
+        # resize) keeps its canvas items and images until the new layout
+        # shows whether they can be reused
+        same_document = document is not None and document is self._rendered_document
+        
         # Store the document
         self.document = document
         
         # Clear any previous render state
-        self._clear_canvas()
+        if not same_document:
+            self._clear_canvas()
         self.processed_nodes = set()
         self.processed_rendered_paragraphs = set()
+        self._text_cache = {}
+        self._child_summary_cache = {}
         
         try:
             # Setup the document title
@@ -505,7 +1249,9 @@ class HTML5Renderer:
         logger.info(f"Document has {element_count} elements")
         
         # Clear any previous content
-        self.clear()
+        if not same_document:
+            self.clear()
+            self.document = document
         
         # More detailed logging for debugging element detection
         logger.debug(f"RENDER DEBUG: document_element exists: {hasattr(document, 'document_element') and document.document_element is not None}")
@@ -530,7 +1276,7 @@ class HTML5Renderer:
         
         # Execute JavaScript if we have a JS engine
         scripts_executed = False
-        if hasattr(self, 'js_engine') and self.js_engine:
+        if hasattr(self, 'js_engine') and self.js_engine and not self._resize_render:
             try:
                 logger.debug("Executing JavaScript in document")
                 self.js_engine.execute_scripts(document)
@@ -576,9 +1322,6 @@ class HTML5Renderer:
             logger.error(f"Error during layout: {e}")
             # Continue anyway to render what we can
         
-        # Render the document
-        self._clear_canvas()
-        
         # Process the layout tree and sort by z-index before rendering
         try:
             self._prepare_stacking_contexts(self.layout_tree)
@@ -587,6 +1330,30 @@ class HTML5Renderer:
             logger.error(f"Error preparing stacking contexts: {e}")
             # Continue anyway
         
+        # Collect box geometry for scroll region and visibility queries
+        old_boxes = self._geometry_boxes
+        old_geometry = (self._bx, self._by, self._bw, self._bh)
+        old_texts = self._box_texts
+        try:
+            self._collect_box_geometry(self.layout_tree)
+            self._precompute_list_indices(self.layout_tree)
+        except Exception as e:
+            logger.error(f"Error collecting box geometry: {e}")
+        
+        # Move the existing canvas items if only their positions changed
+        if same_document and self._reuse_canvas_items(old_boxes, old_geometry, old_texts):
+            try:
+                self._update_scroll_region()
+            except Exception as e:
+                logger.error(f"Error updating scroll region: {e}")
+            self._schedule_cull_check()
+            self._last_render_size = (self.viewport_width, self.viewport_height)
+            logger.info(f"Document re-rendered by reusing canvas items in {time.time() - start_time:.3f}s")
+            return
+        
+        # Render the document
+        self._clear_canvas()
+        
         # Check if we're on the debug page
         is_debug_page = False
         document_url = None
@@ -651,13 +1418,20 @@ class HTML5Renderer:
         self.is_debug_mode = is_debug_page
         
         # Render the layout tree using the _render_element method
+        self._begin_culling()
+        self._rendering = True
         try:
             logger.debug("Starting to render layout tree")
             self._render_element(self.layout_tree, 0, 0)
+            self._flush_draw_queue()
+            self._apply_zoom()
             logger.debug("Layout tree rendered successfully")
         except Exception as e:
             logger.error(f"Error rendering layout tree: {e}")
             self._show_error_message(f"Rendering error: {str(e)}")
+        finally:
+            self._pending_ops = []
+            self._rendering = False
         
         # Update scroll region
         try:
@@ -671,7 +1445,7 @@ class HTML5Renderer:
             # Add a debug message showing CSS/JS processing status
             if not scripts_executed and self.js_engine:
                 debug_text = "⚠️ JavaScript processing issues detected. Scripts may not have executed properly."
-                self.canvas.create_text(10, 10, text=debug_text, anchor="nw", fill="red", font=("Arial", 10, "bold"))
+                self.canvas.create_text(10, 10, text=debug_text, anchor="nw", fill="red", font=self._get_font(("Arial", 10, "bold")))
             
             # Add a debug rectangle to verify content is being rendered
             debug_rect = self.canvas.create_rectangle(
@@ -686,7 +1460,7 @@ class HTML5Renderer:
             debug_text = self.canvas.create_text(
                 200, 200,
                 text="Example.com content should appear here",
-                font=("Arial", 14, "bold"),
+                font=self._get_font(("Arial", 14, "bold")),
                 fill="black"
             )
             self.canvas_items.append(debug_text)
@@ -703,7 +1477,7 @@ class HTML5Renderer:
             header_text = self.canvas.create_text(
                 275, 75,
                 text="DEBUG MODE",
-                font=("Arial", 18, "bold"),
+                font=self._get_font(("Arial", 18, "bold")),
                 fill="navy"
             )
             self.canvas_items.append(header_text)
@@ -715,7 +1489,7 @@ class HTML5Renderer:
                      f"Zoom: {self.zoom_level*100}%\n"
                      f"URL: {document.url if hasattr(document, 'url') else 'Unknown'}\n"
                      f"Elements: {self._count_elements(document) if document else 0}",
-                font=("Arial", 12),
+                font=self._get_font(("Arial", 12)),
                 fill="black",
                 justify="center"
             )
@@ -723,6 +1497,8 @@ class HTML5Renderer:
             
             logger.debug("Added debug elements in debug mode")
         
+        self._last_render_size = (self.viewport_width, self.viewport_height)
+        self._rendered_document = document
         logger.info("Document rendered successfully")
     
     # Helper method to count elements in a document
@@ -847,17 +1623,362 @@ class HTML5Renderer:
     
     def _clear_canvas(self) -> None:
         """Clear the canvas and reset state."""
-        # Delete all canvas items
-        for item_id in self.canvas_items:
+        # Delete all canvas items in a single Tcl call; ids of items that
+        # were already deleted are ignored by Tk
+        if self.canvas_items:
             try:
-                self.canvas.delete(item_id)
-            except TclError:
-                pass  # Item already deleted
+                self.canvas.delete(*self.canvas_items)
+            except TclError as e:
+                logger.error(f"Error clearing canvas: {e}")
         
         self.canvas_items = []
+        self._items_by_element = {}
+        self._pending_ops = []
+        
+        # New items are drawn unzoomed, with fonts at their base size, and
+        # scaled by _apply_zoom once painted
+        self._applied_zoom = 1.0
+        if self._font_scale != 1.0:
+            self._set_font_scale(1.0)
+        self._hit_grid = {}
+        self._hit_rects = []
+        self._pending_image_boxes = {}
+        self._image_items = {}
+    
+    def _queue_draw(self, op: str, coords: Tuple, **opts) -> None:
+        """
+        Queue a canvas draw operation to be created by _flush_draw_queue.
         
-        # Clear the image cache
-        self.image_cache.clear()
+        Args:
+            op: Item type ('rectangle', 'line' or 'text')
+            coords: Item coordinates
+            **opts: Item options passed to the canvas create method
+        """
+        self._pending_ops.append((op, coords, opts, self._painting_key))
+    
+    def _flush_draw_queue(self) -> None:
+        """
+        Create all queued draw operations on the canvas in one Tcl call.
+        
+        Queued items are box decorations (backgrounds, borders, rules, form
+        control frames), so they are lowered beneath the text and images
+        drawn directly during the walk.
+        """
+        if not self._pending_ops:
+            return
+        
+        ops, self._pending_ops = self._pending_ops, []
+        merged = self._merge_line_ops(ops)
+        
+        args = []
+        for op, coords, opts, owner in merged:
+            options = ['-tags', 'decoration']
+            for name, value in opts.items():
+                if name == 'tags':
+                    extra = value if isinstance(value, (tuple, list)) else (value,)
+                    options[1] = ('decoration',) + tuple(tag for tag in extra if tag)
+                else:
+                    options.extend(('-' + name, value))
+            args.extend((op, tuple(coords), tuple(options)))
+        
+        try:
+            item_ids = self.canvas.tk.splitlist(
+                self.canvas.tk.call('::wink_create_items', self.canvas._w, *args)
+            )
+        except TclError as e:
+            logger.error(f"Error drawing queued items: {e}")
+            return
+        
+        items = self.canvas_items
+        items_by_element = self._items_by_element
+        for (op, coords, opts, owner), item_id in zip(merged, item_ids):
+            item_id = str(item_id)
+            if not item_id:
+                logger.error(f"Error drawing queued {op} at {coords}")
+                continue
+            item_id = int(item_id)
+            items.append(item_id)
+            if owner is not None:
+                items_by_element.setdefault(owner, []).append(item_id)
+        
+        self.canvas.tag_lower('decoration')
+    
+    def _merge_line_ops(self, ops: List[Tuple[str, Tuple, Dict[str, Any], Optional[int]]]) -> List[Tuple[str, Tuple, Dict[str, Any], Optional[int]]]:
+        """
+        Merge queued line segments into polylines and drop repeated edges.
+        
+        A segment that starts or ends where the previous line item of the same
+        element ends, with the same options, is appended to it, so a box's
+        borders become one item instead of one per side. Segments the element
+        already queued are skipped. Segments are never merged across elements,
+        so every item still belongs to exactly one element.
+        
+        Args:
+            ops: Queued draw operations in paint order
+            
+        Returns:
+            The draw operations to create
+        """
+        merged = []
+        seen = set()
+        last_line = None
+        
+        for op, coords, opts, owner in ops:
+            if op != 'line' or len(coords) != 4:
+                merged.append((op, coords, opts, owner))
+                last_line = None
+                continue
+            
+            x1, y1, x2, y2 = coords
+            opts_key = (owner, tuple(sorted(opts.items())))
+            if (x1, y1, x2, y2, opts_key) in seen or (x2, y2, x1, y1, opts_key) in seen:
+                continue
+            seen.add((x1, y1, x2, y2, opts_key))
+            
+            if last_line is not None and last_line[2] == opts and last_line[3] == owner:
+                points = last_line[1]
+                end = (points[-2], points[-1])
+                if end == (x1, y1):
+                    points.extend((x2, y2))
+                    continue
+                if end == (x2, y2):
+                    points.extend((x1, y1))
+                    continue
+            
+            last_line = ('line', [x1, y1, x2, y2], opts, owner)
+            merged.append(last_line)
+        
+        return merged
+    
+    def _collect_box_geometry(self, layout_tree: Optional[LayoutBox]) -> None:
+        """
+        Collect the margin box of every layout box into parallel arrays.
+        
+        The text of each box's element is collected alongside, in
+        _box_texts.
+        
+        Args:
+            layout_tree: Root of the layout tree
+        """
+        boxes = []
+        xs, ys, widths, heights = [], [], [], []
+        texts = []
+        
+        def number(value):
+            return value if isinstance(value, (int, float)) else 0
+        
+        stack = [layout_tree] if layout_tree else []
+        while stack:
+            box = stack.pop()
+            metrics = getattr(box, 'box_metrics', None)
+            if metrics is not None:
+                boxes.append(box)
+                xs.append(number(metrics.x))
+                ys.append(number(metrics.y))
+                widths.append(number(metrics.margin_box_width))
+                heights.append(number(metrics.margin_box_height))
+                texts.append(getattr(box.element, 'text_content', None) or '')
+            children = getattr(box, 'children', None)
+            if children:
+                stack.extend(reversed(children))
+        
+        self._geometry_boxes = boxes
+        self._box_texts = texts
+        if NUMPY_AVAILABLE:
+            self._bx = np.asarray(xs, dtype=float)
+            self._by = np.asarray(ys, dtype=float)
+            self._bw = np.asarray(widths, dtype=float)
+            self._bh = np.asarray(heights, dtype=float)
+        else:
+            self._bx, self._by, self._bw, self._bh = xs, ys, widths, heights
+    
+    def _visible_box_ids(self, vx0: float, vy0: float, vx1: float, vy1: float) -> Set[int]:
+        """
+        Find the layout boxes that intersect a rectangle.
+        
+        Args:
+            vx0: Left edge of the rectangle
+            vy0: Top edge of the rectangle
+            vx1: Right edge of the rectangle
+            vy1: Bottom edge of the rectangle
+            
+        Returns:
+            Set of id() values of the intersecting layout boxes
+        """
+        boxes = self._geometry_boxes
+        if NUMPY_AVAILABLE:
+            bx, by, bw, bh = self._bx, self._by, self._bw, self._bh
+            visible_mask = (bx + bw > vx0) & (bx < vx1) & (by + bh > vy0) & (by < vy1)
+            return {id(boxes[i]) for i in np.flatnonzero(visible_mask)}
+        
+        return {
+            id(box)
+            for box, x, y, w, h in zip(boxes, self._bx, self._by, self._bw, self._bh)
+            if x + w > vx0 and x < vx1 and y + h > vy0 and y < vy1
+        }
+    
+    def _content_extent(self) -> Tuple[float, float]:
+        """
+        Get the right and bottom edges of the collected layout boxes.
+        
+        Returns:
+            Tuple of (max_x, max_y), or (0, 0) if no geometry was collected
+        """
+        if not self._geometry_boxes:
+            return 0, 0
+        
+        if NUMPY_AVAILABLE:
+            return float((self._bx + self._bw).max()), float((self._by + self._bh).max())
+        
+        return (
+            max(x + w for x, w in zip(self._bx, self._bw)),
+            max(y + h for y, h in zip(self._by, self._bh)),
+        )
+    
+    def _reuse_canvas_items(self, old_boxes: List[LayoutBox], old_geometry: Tuple, old_texts: List[str]) -> bool:
+        """
+        Update the last pass's canvas items for a new layout of the same document.
+        
+        Items are only reused when the viewport width (which text wrapping
+        depends on) is unchanged and every box kept its element, size, text
+        and computed style. Boxes that moved have their items shifted with
+        canvas.move, and their hit testing rects moved with them.
+        
+        Args:
+            old_boxes: Layout boxes collected by the previous pass
+            old_geometry: The previous (x, y, width, height) arrays
+            old_texts: The previous text of each box's element
+            
+        Returns:
+            True if the canvas items were reused, False if a full render is needed
+        """
+        boxes = self._geometry_boxes
+        if not self._last_render_size or self._last_render_size[0] != self.viewport_width:
+            return False
+        if not boxes or len(boxes) != len(old_boxes):
+            return False
+        
+        moves = {}
+        old_x, old_y, old_w, old_h = old_geometry
+        for i, (old_box, box) in enumerate(zip(old_boxes, boxes)):
+            element = box.element
+            if element is not old_box.element:
+                return False
+            if self._bw[i] != old_w[i] or self._bh[i] != old_h[i]:
+                return False
+            if self._box_texts[i] != old_texts[i] or box.computed_style != old_box.computed_style:
+                return False
+            dx, dy = self._bx[i] - old_x[i], self._by[i] - old_y[i]
+            if dx or dy:
+                moves[id(element)] = (float(dx), float(dy))
+        
+        if not moves:
+            return True
+        
+        # Boxes culled by the last pass have no items to move
+        if self._visible_boxes is not None and len(self._visible_boxes) < len(boxes):
+            return False
+        
+        zoom = self._applied_zoom
+        try:
+            for key, (dx, dy) in moves.items():
+                for item_id in self._items_by_element.get(key, ()):
+                    self.canvas.move(item_id, dx * zoom, dy * zoom)
+        except TclError as e:
+            logger.error(f"Error moving canvas items: {e}")
+            return False
+        
+        self._shift_hit_rects(moves)
+        return True
+    
+    def _shift_hit_rects(self, moves: Dict[int, Tuple[float, float]]) -> None:
+        """
+        Rebuild the hit testing grid with some elements' rects moved.
+        
+        Args:
+            moves: Map of id() of an element to its (dx, dy) offset
+        """
+        # Re-add in paint order so the topmost element still wins
+        entries, self._hit_rects = self._hit_rects, []
+        self._hit_grid = {}
+        for x1, y1, x2, y2, element in entries:
+            dx, dy = moves.get(id(element), (0, 0))
+            self._add_hit_rect(x1 + dx, y1 + dy, x2 - x1, y2 - y1, element)
+        
+        # Images still loading are drawn where their placeholder now is
+        for pending in self._pending_image_boxes.values():
+            for i, (layout_box, x, y, width, height, item_ids) in enumerate(pending):
+                dx, dy = moves.get(id(layout_box.element), (0, 0))
+                pending[i] = (layout_box, x + dx, y + dy, width, height, item_ids)
+    
+    def _begin_culling(self) -> None:
+        """
+        Work out which layout boxes the next render pass should paint.
+        
+        Boxes entirely outside the visible canvas area (plus CULL_MARGIN on
+        every side) are skipped by _render_element.
+        """
+        # The pass is scaled to zoom_level once painted, so the visible area
+        # is converted back to layout coordinates
+        zoom = self.zoom_level
+        try:
+            vx0 = self.canvas.canvasx(0) / zoom - self.CULL_MARGIN
+            vy0 = self.canvas.canvasy(0) / zoom - self.CULL_MARGIN
+            vx1 = vx0 + max(self.canvas.winfo_width(), self.viewport_width) / zoom + 2 * self.CULL_MARGIN
+            vy1 = vy0 + max(self.canvas.winfo_height(), self.viewport_height) / zoom + 2 * self.CULL_MARGIN
+        except TclError:
+            self._cull_rect = None
+            self._visible_boxes = None
+            return
+        
+        self._cull_rect = (vx0, vy0, vx1, vy1)
+        self._visible_boxes = self._visible_box_ids(vx0, vy0, vx1, vy1)
+    
+    def _on_canvas_yscroll(self, first, last) -> None:
+        """
+        Update the vertical scrollbar and repaint if needed after scrolling.
+        
+        Args:
+            first: Fraction of the content above the visible area
+            last: Fraction of the content up to the bottom of the visible area
+        """
+        self.v_scrollbar.set(first, last)
+        self._schedule_cull_check()
+    
+    def _on_canvas_xscroll(self, first, last) -> None:
+        """
+        Update the horizontal scrollbar and repaint if needed after scrolling.
+        
+        Args:
+            first: Fraction of the content left of the visible area
+            last: Fraction of the content up to the right of the visible area
+        """
+        self.h_scrollbar.set(first, last)
+        self._schedule_cull_check()
+    
+    def _schedule_cull_check(self) -> None:
+        """Schedule a debounced check of the painted region after scrolling."""
+        if self._rendering or self._cull_rect is None:
+            return
+        if self._pending_cull_id is not None:
+            self.canvas.after_cancel(self._pending_cull_id)
+        self._pending_cull_id = self.canvas.after(self.RESIZE_DEBOUNCE_MS, self._check_cull_region)
+    
+    def _check_cull_region(self) -> None:
+        """Repaint the layout tree if the visible area left the painted region."""
+        self._pending_cull_id = None
+        if self._cull_rect is None or not self.layout_tree:
+            return
+        
+        zoom = self._applied_zoom
+        vx0, vy0 = self.canvas.canvasx(0) / zoom, self.canvas.canvasy(0) / zoom
+        vx1 = vx0 + self.canvas.winfo_width() / zoom
+        vy1 = vy0 + self.canvas.winfo_height() / zoom
+        cx0, cy0, cx1, cy1 = self._cull_rect
+        if vx0 >= cx0 and vy0 >= cy0 and vx1 <= cx1 and vy1 <= cy1:
+            return
+        
+        self._render_layout_tree(self.layout_tree)
     
     def _update_scroll_region(self) -> None:
         """Update the scroll region based on the content size."""
@@ -904,6 +2025,17 @@ class HTML5Renderer:
                 if total_height > max_y:
                     max_y = total_height
             
+            # Include descendants that extend past the root box
+            extent_x, extent_y = self._content_extent()
+            max_x = max(max_x, int(extent_x))
+            max_y = max(max_y, int(extent_y))
+            
+            # Layout sizes are unzoomed
+            zoom = self._applied_zoom
+            if zoom != 1.0:
+                max_x = max(self.viewport_width, int(max_x * zoom))
+                max_y = max(self.viewport_height, int(max_y * zoom))
+            
             # Add padding to ensure scrollbar controls are visible
             max_x += 20
             max_y += 20
@@ -1001,8 +2133,30 @@ class HTML5Renderer:
         # Clear the canvas
         self._clear_canvas()
         
+        # Collect box geometry for scroll region and visibility queries
+        try:
+            self._collect_box_geometry(layout_tree)
+            self._precompute_list_indices(layout_tree)
+        except Exception as e:
+            logger.error(f"Error collecting box geometry: {e}")
+        
+        # Each pass paints text from scratch
+        self.processed_nodes = set()
+        self.processed_rendered_paragraphs = set()
+        self.in_progress_paragraphs = set()
+        self._text_cache = {}
+        self._child_summary_cache = {}
+        
         # Render the layout tree recursively
-        self._render_element(layout_tree, 0, 0)
+        self._begin_culling()
+        self._rendering = True
+        try:
+            self._render_element(layout_tree, 0, 0)
+            self._flush_draw_queue()
+            self._apply_zoom()
+        finally:
+            self._pending_ops = []
+            self._rendering = False
         
         # Update the scroll region
         self._update_scroll_region()
@@ -1065,7 +2219,7 @@ class HTML5Renderer:
         title_text = self.canvas.create_text(
             x, y, 
             text=title,
-            font=("Arial", 16, "bold"),
+            font=self._get_font(("Arial", 16, "bold")),
             anchor="nw",
             fill="#000000"
         )
@@ -1078,10 +2232,11 @@ class HTML5Renderer:
         content_text = self.canvas.create_text(
             x, y, 
             text=text_content[:5000],  # Limit text to avoid performance issues
-            font=("Arial", 12),
+            font=self._get_font(("Arial", 12)),
             anchor="nw",
             fill="#000000",
-            width=self.viewport_width - 40  # Allow wrapping
+            width=self.viewport_width - 40,  # Allow wrapping
+            tags='text'  # Rewrapped when zooming
         )
         self.canvas_items.append(content_text)
         
@@ -1125,10 +2280,12 @@ class HTML5Renderer:
             text = ""
             
         # If node is not a text node itself, recursively get text from children
-        if (not text or text.strip() == "") and hasattr(node, 'child_nodes'):
-            for child in node.child_nodes:
+        child_nodes = getattr(node, 'child_nodes', None)
+        if (not text or text.strip() == "") and child_nodes:
+            for child in child_nodes:
                 # Skip script and style elements
-                if hasattr(child, 'tag_name') and child.tag_name.lower() in ['script', 'style']:
+                child_tag = self._tag_name_of(child)
+                if child_tag in self.NON_RENDERED_TAGS:
                     continue
                     
                 child_text = self._extract_text_content(child)
@@ -1139,10 +2296,7 @@ class HTML5Renderer:
                 if child_text.strip():
                     if text and not text.endswith('\n'):
                         # Add newline between block elements
-                        if hasattr(child, 'tag_name') and child.tag_name.lower() in [
-                            'div', 'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 
-                            'ul', 'ol', 'li', 'table', 'tr', 'blockquote'
-                        ]:
+                        if child_tag in self.TEXT_BREAK_TAGS:
                             text += '\n'
                         # Add space between inline elements
                         elif text and not text.endswith(' '):
@@ -1168,22 +2322,20 @@ class HTML5Renderer:
             return
             
         # Get tag name
-        tag_name = element.tag_name.lower() if hasattr(element, 'tag_name') else ""
-        logger.debug(f"Rendering content for element: {tag_name}")
+        tag_name = self._tag_name_of(element)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Rendering content for element: {tag_name}")
         
         # Skip rendering content of certain elements
-        if tag_name == 'script' or tag_name == 'style':
-            logger.debug(f"Skipping content rendering for {tag_name} element")
+        if tag_name in self.NON_RENDERED_TAGS:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Skipping content rendering for {tag_name} element")
             return
         
-        # Handle different element types
-        if tag_name == 'img':
-            self._render_image(layout_box, x, y, width, height)
-        elif tag_name in ('input', 'button', 'textarea', 'select'):
-            self._render_form_element(layout_box, x, y, width, height)
-        elif tag_name in ('h1', 'h2', 'h3', 'h4', 'h5', 'h6'):
-            # Special handling for headings to ensure they stand out
-            self._render_heading_element(layout_box)
+        # Handle different element types (images, form controls, headings)
+        handler = self._content_dispatch.get(tag_name)
+        if handler:
+            handler(layout_box, x, y, width, height)
         else:
             # For body element, ensure we process all children
             if tag_name == 'body':
@@ -1196,7 +2348,7 @@ class HTML5Renderer:
                         placeholder = self.canvas.create_text(
                             x + 20, y + 20,
                             text="This page has no visible content.",
-                            font=("Arial", 14),
+                            font=self._get_font(("Arial", 14)),
                             fill="#666666",
                             anchor="nw"
                         )
@@ -1212,7 +2364,7 @@ class HTML5Renderer:
                             logger.debug(f"Body child {i}: {child_tag}")
                             
                             # For block elements, ensure they're rendered with proper spacing
-                            if child_tag in ('div', 'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'ul', 'ol', 'table'):
+                            if child_tag in self.BLOCK_TAGS:
                                 # These will be rendered by the layout engine through their own layout boxes
                                 pass
                         elif hasattr(child, 'nodeType') and child.nodeType == 3:  # Text node
@@ -1223,7 +2375,7 @@ class HTML5Renderer:
                                     text_item = self.canvas.create_text(
                                         x + 10, y + 10,
                                         text=child.nodeValue,
-                                        font=("Arial", 12),
+                                        font=self._get_font(("Arial", 12)),
                                         fill="#000000",
                                         anchor="nw"
                                     )
@@ -1232,18 +2384,20 @@ class HTML5Renderer:
                                     logger.error(f"Error rendering direct text node: {e}")
             elif tag_name == 'div':
                 # For div elements, ensure we handle them properly
-                logger.debug(f"Rendering div element at ({x}, {y}) with dimensions {width}x{height}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Rendering div element at ({x}, {y}) with dimensions {width}x{height}")
                 
                 # Check if this is a container div with children but no text
-                has_text = False
-                if hasattr(element, 'textContent'):
-                    has_text = bool(element.textContent.strip())
+                has_text = bool(self._text(element).strip())
                 
                 # If it's a container with no text but with children, we don't need to render text
                 if not has_text and hasattr(element, 'child_nodes') and len(element.child_nodes) > 0:
                     logger.debug("Div is a container with no direct text, skipping text rendering")
                     return
             
+            elif tag_name == 'li':
+                self._render_list_marker(layout_box, x, y)
+            
             # Render text content for all elements
             self._render_text_content(layout_box)
             
@@ -1266,25 +2420,14 @@ class HTML5Renderer:
                 if parent_tag == 'p':
                     # First check using the mixed content detection logic used by _render_text_content
                     # to ensure consistency with how paragraphs with links are detected
-                    has_links = False
-                    has_text = False
-                    
-                    if hasattr(parent_element, 'child_nodes'):
-                        for child in parent_element.child_nodes:
-                            if hasattr(child, 'tag_name') and child.tag_name.lower() == 'a':
-                                has_links = True
-                            elif hasattr(child, 'node_type') and child.node_type == 3:  # Text node
-                                if hasattr(child, 'node_value') and child.node_value and child.node_value.strip():
-                                    has_text = True
+                    has_links, has_text, _ = self._child_summary(parent_element)
                     
                     # If paragraph has both links and text, don't use old implementation
                     if has_links and has_text:
                         use_old_implementation = False
                     else:
                         # Fallback check - if paragraph has any text content at all
-                        has_text_content = False
-                        if hasattr(parent_element, 'textContent'):
-                            has_text_content = bool(parent_element.textContent.strip())
+                        has_text_content = bool(self._text(parent_element).strip())
                         
                         # Only use old implementation if paragraph is empty (no text content)
                         use_old_implementation = not has_text_content
@@ -1300,6 +2443,79 @@ class HTML5Renderer:
                 # Nothing to do for <br> - layout engine handles line breaks
                 pass
     
+    def _precompute_list_indices(self, layout_tree: Optional[LayoutBox]) -> None:
+        """
+        Assign each list item its marker text in a single pass over the tree.
+        
+        Items of an <ol> are numbered from its start attribute (default 1);
+        items of a <ul> get a bullet. The marker is stored on the item's
+        element as _list_marker, or None when the list has list-style none.
+        
+        Args:
+            layout_tree: Root of the layout tree
+        """
+        stack = [layout_tree] if layout_tree else []
+        while stack:
+            box = stack.pop()
+            children = getattr(box, 'children', None)
+            if not children:
+                continue
+            stack.extend(children)
+            
+            list_tag = self._tag_name_of(box.element) if box.element else ''
+            if list_tag not in ('ol', 'ul'):
+                continue
+            
+            style = getattr(box, 'computed_style', None) or {}
+            if style.get('list-style-type', style.get('list-style', '')) == 'none':
+                marker = None
+            elif list_tag == 'ul':
+                marker = '\u2022'
+            else:
+                marker = ''
+            
+            start = 1
+            if list_tag == 'ol' and hasattr(box.element, 'get_attribute'):
+                try:
+                    start = int(box.element.get_attribute('start') or 1)
+                except ValueError:
+                    start = 1
+            
+            items = [child.element for child in children
+                     if child.element and self._tag_name_of(child.element) == 'li']
+            for index, item in enumerate(items, start):
+                item.__dict__['_list_index'] = index
+                item.__dict__['_list_marker'] = f"{index}." if marker == '' else marker
+    
+    def _render_list_marker(self, layout_box: LayoutBox, x: int, y: int) -> None:
+        """
+        Draw the bullet or number of a list item to the left of its box.
+        
+        Args:
+            layout_box: The layout box of the <li> element
+            x: X coordinate of the item
+            y: Y coordinate of the item
+        """
+        marker = getattr(layout_box.element, '_list_marker', None)
+        if not marker:
+            return
+        
+        style = layout_box.computed_style if hasattr(layout_box, 'computed_style') else {}
+        font_size = self._parse_size(str(style.get('font-size', '12px'))) or 12
+        font = (style.get('font-family', self.fonts['default'][0]), font_size)
+        
+        try:
+            marker_item = self.canvas.create_text(
+                x - 6, y + layout_box.box_metrics.padding_top + layout_box.box_metrics.border_top_width,
+                text=marker,
+                font=self._get_font(font),
+                fill=style.get('color', '#000000'),
+                anchor="ne"
+            )
+            self.canvas_items.append(marker_item)
+        except Exception as e:
+            logger.error(f"Error rendering list marker: {e}")
+    
     def _render_heading_element(self, layout_box: LayoutBox) -> None:
         """
         Render a heading element (h1-h6).
@@ -1312,15 +2528,11 @@ class HTML5Renderer:
             return
             
         tag_name = element.tag_name.lower()
-        if not tag_name in ('h1', 'h2', 'h3', 'h4', 'h5', 'h6'):
+        if tag_name not in self.HEADING_TAGS:
             return
             
         # Get text content
-        text = ""
-        if hasattr(element, 'textContent'):
-            text = element.textContent
-        elif hasattr(element, 'text_content'):
-            text = element.text_content
+        text = self._text(element)
             
         if not text:
             return
@@ -1362,10 +2574,11 @@ class HTML5Renderer:
             heading_text = self.canvas.create_text(
                 x, y,
                 text=text,
-                font=font,
+                font=self._get_font(font),
                 fill=color,
                 anchor="nw",
-                width=width if width != 'auto' and width > 0 else None
+                width=width if width != 'auto' and width > 0 else None,
+                tags='text'  # Rewrapped when zooming
             )
             self.canvas_items.append(heading_text)
             
@@ -1375,235 +2588,204 @@ class HTML5Renderer:
         except Exception as e:
             logger.error(f"Error rendering heading: {e}")
     
-    def _render_media_element(self, layout_box: LayoutBox) -> None:
-        """
-        Render a media element (audio or video).
-        
-        Args:
-            layout_box: The layout box to render
-        """
-        element = layout_box.element
-        if not element:
-            return
-            
-        # Get media source
-        src = element.get_attribute('src') if hasattr(element, 'get_attribute') else None
-        
-        # Get box dimensions
-        x = layout_box.box_metrics.x + layout_box.box_metrics.margin_left + layout_box.box_metrics.border_left_width + layout_box.box_metrics.padding_left
-        y = layout_box.box_metrics.y + layout_box.box_metrics.margin_top + layout_box.box_metrics.border_top_width + layout_box.box_metrics.padding_top
-        width = layout_box.box_metrics.content_width
-        height = layout_box.box_metrics.content_height
-        
-        # Check if controls should be shown
-        has_controls = element.get_attribute('controls') == 'controls' if hasattr(element, 'get_attribute') else False
-        
-        # Check the element type and call the appropriate renderer
-        tag_name = element.tag_name.lower() if hasattr(element, 'tag_name') else ''
-        if tag_name == 'audio':
-            self._render_audio_element(x, y, width, height, src, has_controls, element)
-        elif tag_name == 'video':
-            self._render_video_element(x, y, width, height, src, has_controls, element)
-    
     def _render_element_box(self, layout_box: LayoutBox) -> None:
         """
         Render a specific element box based on its type.
         
-        Args:
-            layout_box: The layout box to render
-        """
-        element = layout_box.element
-        if not element or not hasattr(element, 'tag_name'):
-            return
-            
-        # First render the container/background for all elements
-        self._render_default_element_box(layout_box)
-        
-        # Note: We no longer call specific render methods here to avoid duplication
-        # The _render_element_content method will handle rendering the specific content
-    
-    def _render_image_element(self, layout_box: LayoutBox) -> None:
-        """
-        Render an image element.
-        
-        Args:
-            layout_box: The layout box to render
-        """
-        element = layout_box.element
-        if not element:
-            return
-            
-        # Get image source
-        src = element.get_attribute('src') if hasattr(element, 'get_attribute') else None
-        if not src:
-            return
-            
-        # Get box dimensions
-        x = layout_box.box_metrics.x + layout_box.box_metrics.margin_left + layout_box.box_metrics.border_left_width + layout_box.box_metrics.padding_left
-        y = layout_box.box_metrics.y + layout_box.box_metrics.margin_top + layout_box.box_metrics.border_top_width + layout_box.box_metrics.padding_top
-        width = layout_box.box_metrics.content_width
-        height = layout_box.box_metrics.content_height
-        
-        # Get parent container dimensions for percentage calculations
-        parent_width = layout_box.parent.box_metrics.content_width if layout_box.parent else self.canvas.winfo_width()
-        parent_height = layout_box.parent.box_metrics.content_height if layout_box.parent else self.canvas.winfo_height()
-        
-        # Convert 'auto' to numeric values
-        if width == 'auto':
-            width = int(parent_width * 0.8)  # Default to 80% of parent width
-        elif isinstance(width, str) and width.endswith('%'):
-            width = self._convert_percentage_to_pixels(width, parent_width)
-        
-        if height == 'auto':
-            height = int(parent_height * 0.32)  # Default to 32% of parent height
-        elif isinstance(height, str) and height.endswith('%'):
-            height = self._convert_percentage_to_pixels(height, parent_height)
-            
-        # Use specified dimensions if provided in element attributes
-        if width <= 0 or isinstance(width, str):
-            width_attr = element.get_attribute('width') if hasattr(element, 'get_attribute') else None
-            if width_attr:
-                if width_attr.endswith('%'):
-                    width = self._convert_percentage_to_pixels(width_attr, parent_width)
-                else:
-                    try:
-                        width = int(float(width_attr))
-                    except (ValueError, TypeError):
-                        width = int(parent_width * 0.8)  # Default to 80% of parent width
-            else:
-                width = int(parent_width * 0.8)  # Default to 80% of parent width
-        
-        if height <= 0 or isinstance(height, str):
-            height_attr = element.get_attribute('height') if hasattr(element, 'get_attribute') else None
-            if height_attr:
-                if height_attr.endswith('%'):
-                    height = self._convert_percentage_to_pixels(height_attr, parent_height)
-                else:
-                    try:
-                        height = int(float(height_attr))
-                    except (ValueError, TypeError):
-                        height = int(parent_height * 0.32)  # Default to 32% of parent height
-            else:
-                height = int(parent_height * 0.32)  # Default to 32% of parent height
-        
-        # Check if we already have the image
-        img = self._get_image(src)
-        
-        if img:
-            # Draw the image on the canvas
-            try:
-                # Create a PhotoImage object
-                photo = tk.PhotoImage(data=img)
-                
-                # Store the photo so it doesn't get garbage collected
-                if not hasattr(self, '_photo_cache'):
-                    self._photo_cache = {}
-                self._photo_cache[src] = photo
-                
-                # Create the image on the canvas
-                image_item = self.canvas.create_image(
-                    x, y,
-                    image=photo,
-                    anchor='nw',
-                    tags=f'element:{element.id}' if hasattr(element, 'id') and element.id else ''
-                )
-                self.canvas_items.append(image_item)
-                
-                # Add debug rectangle to show image bounds
-                if self.draw_debug_boxes:
-                    debug_rect = self.canvas.create_rectangle(
-                        x, y, x + width, y + height,
-                        outline='red',
-                        fill='',
-                        width=1,
-                        tags=f'debug element:{element.id}' if hasattr(element, 'id') and element.id else 'debug'
-                    )
-                    self.canvas_items.append(debug_rect)
-                
-                # Log success
-                logger.debug(f"Rendered image: {src}")
-                return
-            except Exception as e:
-                logger.error(f"Error rendering image: {e}")
-        
-        # If we reached here, we couldn't load the image
-        # Show a placeholder
-        placeholder = self.canvas.create_rectangle(
-            x, y, x + width, y + height,
-            outline='#CCCCCC',
-            fill='#EEEEEE',
-            tags=f'element:{element.id}' if hasattr(element, 'id') and element.id else ''
-        )
-        self.canvas_items.append(placeholder)
-        
-        # Add a broken image icon
-        label = self.canvas.create_text(
-            x + width/2, y + height/2,
-            text="🖼️",
-            font=(self.fonts['default'][0], 14),
-            fill='#999999',
-            tags=f'element:{element.id}' if hasattr(element, 'id') and element.id else ''
-        )
-        self.canvas_items.append(label)
+        Args:
+            layout_box: The layout box to render
+        """
+        element = layout_box.element
+        if not element or not hasattr(element, 'tag_name'):
+            return
+            
+        # First render the container/background for all elements
+        self._render_default_element_box(layout_box)
         
-        # Start loading the image in the background
-        self._start_image_loading(src)
-
-    def _start_image_loading(self, src):
+        # Note: We no longer call specific render methods here to avoid duplication
+        # The _render_element_content method will handle rendering the specific content
+    
+    def _start_image_loading(self, src, size=None):
         """
         Start loading an image in the background.
         
         Args:
             src: Image source URL
+            size: Optional (width, height) to also resize the image to
         """
-        # Create a thread to load the image
-        if not hasattr(self, '_image_loading_threads'):
-            self._image_loading_threads = {}
-            
         # Skip if already loading
-        if src in self._image_loading_threads and self._image_loading_threads[src].is_alive():
+        if src in self._img_loading:
             return
             
-        # Create a new thread
-        thread = threading.Thread(target=self._load_image_in_background, args=(src,))
-        thread.daemon = True
-        self._image_loading_threads[src] = thread
-        thread.start()
+        self._img_loading.add(src)
+        self._img_executor.submit(self._load_image_in_background, src, size)
+        self._ensure_image_polling()
+    
+    def _start_image_resize(self, src, image, size):
+        """
+        Start resizing a loaded image in the background.
         
-    def _load_image_in_background(self, src):
+        Args:
+            src: Image source URL
+            image: The decoded image
+            size: (width, height) to resize the image to
+        """
+        key = (src,) + tuple(size)
+        if key in self._img_loading:
+            return
+        
+        self._img_loading.add(key)
+        self._img_executor.submit(self._resize_image_in_background, src, image, size)
+        self._ensure_image_polling()
+    
+    def _ensure_image_polling(self):
+        """Make sure background image results are being collected on the Tk thread."""
+        if self._img_poll_id is None:
+            self._img_poll_id = self.canvas.after(self.IMAGE_POLL_MS, self._poll_image_queue)
+    
+    def _load_image_in_background(self, src, size=None):
         """
-        Load an image in the background.
+        Load and decode an image on a worker thread.
+        
+        The result is posted to the image queue; no Tk calls are made here.
+        If a size is given, the resized image is posted first so it is in
+        place when the decoded image triggers a redraw.
         
         Args:
             src: Image source URL
+            size: Optional (width, height) to also resize the image to
         """
+        image = None
         try:
-            # Try to load the image
-            image_data = self._get_image(src)
-            if image_data:
-                # Schedule a redraw
-                if hasattr(self, 'canvas'):
-                    self.canvas.after(100, self._redraw_images, src)
+            # Try to load the image, forcing the decode while off the Tk thread
+            image = self._get_image(src)
+            if image:
+                image.load()
+                if size:
+                    self._img_queue.put((src, size, image.resize(size, Image.Resampling.BILINEAR)))
         except Exception as e:
             logger.error(f"Error loading image in background: {e}")
+        finally:
+            self._img_queue.put((src, None, image))
+    
+    def _resize_image_in_background(self, src, image, size):
+        """
+        Resize a decoded image on a worker thread.
+        
+        PIL releases the GIL while resampling, so resizes run in parallel
+        with each other and with the Tk thread.
+        
+        Args:
+            src: Image source URL
+            image: The decoded image
+            size: (width, height) to resize the image to
+        """
+        resized = None
+        try:
+            resized = image.resize(size, Image.Resampling.BILINEAR)
+        except Exception as e:
+            logger.error(f"Error resizing image in background: {e}")
+        finally:
+            self._img_queue.put((src, size, resized))
+    
+    def _poll_image_queue(self):
+        """Collect images loaded in the background and draw them."""
+        self._img_poll_id = None
+        
+        loaded = {}
+        while True:
+            try:
+                src, size, image = self._img_queue.get_nowait()
+            except queue.Empty:
+                break
+            if size is None:
+                self._img_loading.discard(src)
+                if image:
+                    self.image_cache[src] = image
+                    loaded[src] = True
+                else:
+                    self._pending_image_boxes.pop(src, None)
+            else:
+                key = (src,) + tuple(size)
+                self._img_loading.discard(key)
+                if image:
+                    self._sized_image_cache[key] = image
+                    if src in self.image_cache:
+                        loaded[src] = True
+        
+        for src in loaded:
+            self._redraw_images(src)
+        
+        # Keep polling while loads are outstanding
+        if self._img_loading:
+            self._img_poll_id = self.canvas.after(self.IMAGE_POLL_MS, self._poll_image_queue)
     
     def _redraw_images(self, src):
         """
         Redraw images after they've been loaded.
         
+        Only the placeholders drawn for this source are replaced; the rest
+        of the canvas is left as is.
+        
         Args:
             src: Image source URL
         """
-        # Find all image elements with this source
         if not hasattr(self, 'canvas') or not self.canvas:
             return
             
-        # Redraw the entire document for now
-        # In a real implementation, would only redraw affected images
-        if hasattr(self, 'layout_tree') and self.layout_tree:
-            self._clear_canvas()
-            self._render_element(self.layout_tree, 0, 0)
-            self._update_scroll_region()
+        for layout_box, x, y, width, height, item_ids in self._pending_image_boxes.pop(src, ()):
+            self._redraw_image_box(layout_box, x, y, width, height, item_ids)
+    
+    def _redraw_image_box(self, layout_box: LayoutBox, x: int, y: int, width: int, height: int, item_ids) -> None:
+        """
+        Replace the items drawn for an image box outside of a render pass.
+        
+        Args:
+            layout_box: The layout box of the image
+            x: X coordinate (unzoomed)
+            y: Y coordinate (unzoomed)
+            width: Width of the image (unzoomed)
+            height: Height of the image (unzoomed)
+            item_ids: Ids of the canvas items to replace
+        """
+        for item_id in item_ids:
+            try:
+                self.canvas.delete(item_id)
+            except TclError:
+                pass  # Item already deleted
+        
+        items = self.canvas_items
+        first_item = len(items)
+        self._render_image(layout_box, x, y, width, height)
+        if len(items) > first_item:
+            new_items = items[first_item:]
+            self._items_by_element.setdefault(id(layout_box.element), []).extend(new_items)
+            
+            # Place the new items where the zoomed layout has them
+            if self._applied_zoom != 1.0:
+                for item_id in new_items:
+                    self.canvas.scale(item_id, 0, 0, self._applied_zoom, self._applied_zoom)
+    
+    def _network_get(self, url: str):
+        """
+        Fetch a URL with the network manager.
+        
+        NetworkManager.get returns HTTP error pages as ordinary responses, so
+        errors are raised here as urllib HTTPErrors, which the 404 fallbacks
+        in _get_image already handle for direct requests.
+        
+        Args:
+            url: The URL to fetch
+            
+        Returns:
+            The successful response
+        """
+        response = self.network_manager.get(url)
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as e:
+            raise urllib.error.HTTPError(url, response.status_code, response.reason, response.headers, None) from e
+        return response
     
     def _get_image(self, src):
         """
@@ -1703,7 +2885,7 @@ class HTML5Renderer:
                         # Use network manager if available
                         if self.network_manager:
                             logger.info(f"Using network manager to fetch: {full_url}")
-                            response = self.network_manager.get(full_url)
+                            response = self._network_get(full_url)
                             if response and response.content:
                                 # Check if it's an SVG
                                 content_type = response.headers.get('Content-Type', '').lower()
@@ -1768,7 +2950,7 @@ class HTML5Renderer:
                                 try:
                                     logger.info(f"Trying alternative URL: {alt_url}")
                                     if self.network_manager:
-                                        response = self.network_manager.get(alt_url)
+                                        response = self._network_get(alt_url)
                                         if response and response.content:
                                             image_data = response.read()
                                             content_type = response.headers.get('Content-Type', '').lower()
@@ -1830,7 +3012,7 @@ class HTML5Renderer:
                         # Use network manager if available
                         if self.network_manager:
                             logger.info(f"Using network manager to fetch: {full_url}")
-                            response = self.network_manager.get(full_url)
+                            response = self._network_get(full_url)
                             if response and response.content:
                                 # Check if it's an SVG
                                 content_type = response.headers.get('Content-Type', '').lower()
@@ -1895,7 +3077,7 @@ class HTML5Renderer:
                                 try:
                                     logger.info(f"Trying alternative URL: {alt_url}")
                                     if self.network_manager:
-                                        response = self.network_manager.get(alt_url)
+                                        response = self._network_get(alt_url)
                                         if response and response.content:
                                             image_data = response.read()
                                             content_type = response.headers.get('Content-Type', '').lower()
@@ -1945,7 +3127,7 @@ class HTML5Renderer:
                     # Try to use the network manager if available
                     if self.network_manager:
                         logger.info(f"Using network manager to fetch: {full_url}")
-                        response = self.network_manager.get(full_url)
+                        response = self._network_get(full_url)
                         if response and response.content:
                             # Check if it's an SVG
                             content_type = response.headers.get('Content-Type', '').lower()
@@ -2038,15 +3220,79 @@ class HTML5Renderer:
         """
         Render a layout box and its children.
         
+        The tree is walked with an explicit stack in paint order (each box
+        before its children, children in order), so deep documents don't pay
+        for a Python call frame per level or hit the recursion limit.
+        
+        Args:
+            layout_box: The layout box to render
+            x_offset: X offset for positioning
+            y_offset: Y offset for positioning
+        """
+        items = self.canvas_items
+        items_by_element = self._items_by_element
+        outer_key = self._painting_key
+        stack = [layout_box]
+        while stack:
+            box = stack.pop()
+            element = getattr(box, 'element', None)
+            self._painting_key = id(element) if element is not None else None
+            first_item = len(items)
+            try:
+                render_children = self._render_box(box, x_offset, y_offset)
+            finally:
+                self._painting_key = outer_key
+            if len(items) > first_item and element is not None:
+                items_by_element.setdefault(id(element), []).extend(items[first_item:])
+            if render_children:
+                children = box.children
+                if children:
+                    stack.extend(reversed(children))
+    
+    def _render_box(self, layout_box: LayoutBox, x_offset: int = 0, y_offset: int = 0) -> bool:
+        """
+        Render a single layout box, without its children.
+        
         Args:
             layout_box: The layout box to render
             x_offset: X offset for positioning
             y_offset: Y offset for positioning
+            
+        Returns:
+            True if the box's children should be rendered
         """
         if not layout_box or not layout_box.element:
-            return
+            return False
             
-        tag_name = layout_box.element.tag_name.lower() if hasattr(layout_box.element, 'tag_name') else 'unknown'
+        tag_name = self._tag_name_of(layout_box.element) or 'unknown'
+        
+        # Runs for every box, so only build debug messages when they are logged
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
+        # Get computed style
+        style = layout_box.computed_style if hasattr(layout_box, 'computed_style') else {}
+        style_get = style.get
+        
+        # Skip invisible elements, and their whole subtree, before doing
+        # any other work on them
+        display = style_get('display', 'block')
+        visibility = style_get('visibility', 'visible')
+        
+        if display == 'none' or visibility == 'hidden':
+            if debug:
+                logger.debug(f"Skipping invisible element {tag_name}: display={display}, visibility={visibility}")
+            return False
+        
+        # A zero-area box paints nothing itself, and nothing at all if it
+        # clips its children
+        metrics = layout_box.box_metrics
+        margin_width, margin_height = metrics.margin_box_width, metrics.margin_box_height
+        zero_area = (
+            isinstance(margin_width, (int, float)) and isinstance(margin_height, (int, float))
+            and (margin_width <= 0 or margin_height <= 0)
+        )
+        if zero_area and style_get('overflow', 'visible') != 'visible':
+            return False
         
         # Calculate dimensions safely
         try:
@@ -2106,40 +3352,51 @@ class HTML5Renderer:
             y = layout_box.box_metrics.y + y_offset
             
             # Log box metrics for debugging
-            logger.debug(f"Box metrics for {tag_name}: x={x}, y={y}, width={width}, height={height}")
+            if debug:
+                logger.debug(f"Box metrics for {tag_name}: x={x}, y={y}, width={width}, height={height}")
         else:
             x = getattr(layout_box, 'x', 0) + x_offset
             y = getattr(layout_box, 'y', 0) + y_offset
-            logger.debug(f"Using fallback positioning for {tag_name}: x={x}, y={y}, width={width}, height={height}")
-            
-        # Get computed style
-        style = layout_box.computed_style if hasattr(layout_box, 'computed_style') else {}
+            if debug:
+                logger.debug(f"Using fallback positioning for {tag_name}: x={x}, y={y}, width={width}, height={height}")
         
-        # Skip rendering if element is not visible
-        display = style.get('display', 'block')
-        visibility = style.get('visibility', 'visible')
-        
-        if display == 'none' or visibility == 'hidden':
-            logger.debug(f"Skipping invisible element {tag_name}: display={display}, visibility={visibility}")
-            return
+        # Tk converts integer coordinates faster than floats, so round once
+        # here for everything drawn for this box
+        try:
+            x, y, width, height = round(x), round(y), round(width), round(height)
+        except (TypeError, ValueError):
+            pass
             
-        # Get z-index
-        z_index = style.get('z-index', 'auto')
-        
-        # Render the element's background and border
-        self._render_background(layout_box, x, y, width, height)
-        self._render_border(layout_box, x, y, width, height)
-        
-        # Render the element's content
-        self._render_element_content(layout_box, x, y, width, height)
+        # Record the box for hit testing
+        try:
+            self._add_hit_rect(x, y, width, height, layout_box.element)
+        except (TypeError, ValueError):
+            pass
+        
+        # Skip painting boxes outside the visible region. Their children can
+        # only be skipped too if they are clipped to this box.
+        if self._visible_boxes is not None and id(layout_box) not in self._visible_boxes:
+            if style_get('overflow', 'visible') != 'visible':
+                return False
+        else:
+            # Render the element's background and border. Most boxes have
+            # neither, which one cached paint plan lookup tells us up front.
+            if not zero_area and style and self._paint_plan(style) != (None, ()):
+                self._render_background(layout_box, x, y, width, height)
+                self._render_border(layout_box, x, y, width, height)
+            
+            # Render the element's content
+            self._render_element_content(layout_box, x, y, width, height)
         
         # Render children
-        if hasattr(layout_box, 'children') and layout_box.children:
-            logger.debug(f"Rendering {len(layout_box.children)} children of {tag_name}")
-            for child in layout_box.children:
-                self._render_element(child, x_offset, y_offset)
-        else:
+        if getattr(layout_box, 'children', None):
+            if debug:
+                logger.debug(f"Rendering {len(layout_box.children)} children of {tag_name}")
+            return True
+        
+        if debug:
             logger.debug(f"Element {tag_name} has no children to render")
+        return False
     
     def _render_background(self, layout_box: LayoutBox, x: int, y: int, width: int, height: int) -> None:
         """
@@ -2159,48 +3416,89 @@ class HTML5Renderer:
         style = layout_box.computed_style
         if not style:
             return
-            
-        # Get the background color
-        bg_color = style.get('background-color', 'transparent')
-        if bg_color == 'transparent':
+        
+        bg_color = self._paint_plan(style)[0]
+        if bg_color is None:
             return
+        
+        # Queue a rectangle for the background
+        self._queue_draw(
+            'rectangle', (x, y, x + width, y + height),
+            fill=bg_color,
+            outline=""  # No outline
+        )
+    
+    def _paint_plan(self, style: Dict[str, Any]) -> Tuple[Optional[str], Tuple[Tuple[str, int, str], ...]]:
+        """
+        Resolve the background and border paint of a computed style.
+        
+        Only the style-dependent work (color conversion, border width
+        parsing) is done here, once per distinct combination of values; the
+        result is cached so boxes sharing a style only add their geometry.
+        
+        Args:
+            style: The computed style of an element
             
-        # Convert the color to a format Tkinter can understand
+        Returns:
+            Tuple of (background color or None, ((side, width, color), ...))
+            listing the border sides that are drawn
+        """
+        key = tuple(map(style.get, self.PAINT_PROPERTIES))
         try:
-            # Handle named colors
-            if bg_color in NAMED_COLORS:
-                bg_color = NAMED_COLORS[bg_color]
-                
-            # Handle hex colors
-            if bg_color.startswith('#'):
-                # Ensure it's a valid hex color
-                if len(bg_color) == 4:  # #RGB format
-                    r = bg_color[1] * 2
-                    g = bg_color[2] * 2
-                    b = bg_color[3] * 2
-                    bg_color = f"#{r}{g}{b}"
-                    
-            # Handle rgb() format
-            elif bg_color.startswith('rgb('):
-                # Extract the RGB values
-                rgb_values = bg_color[4:-1].split(',')
-                if len(rgb_values) == 3:
-                    r = int(rgb_values[0].strip())
-                    g = int(rgb_values[1].strip())
-                    b = int(rgb_values[2].strip())
-                    bg_color = f"#{r:02x}{g:02x}{b:02x}"
+            plan = self._paint_plan_cache.get(key)
+        except TypeError:
+            key = plan = None  # Unhashable value; resolve without caching
+        if plan is not None:
+            return plan
+        
+        # Background color
+        bg_color = style.get('background-color', 'transparent')
+        if (not bg_color or bg_color in self.TRANSPARENT_BACKGROUNDS
+                or self.TRANSPARENT_RGBA_RE.match(str(bg_color))):
+            bg_color = None
+        else:
+            try:
+                # Handle named colors
+                if bg_color in NAMED_COLORS:
+                    bg_color = NAMED_COLORS[bg_color]
                     
-            # Create a rectangle for the background
-            bg_rect = self.canvas.create_rectangle(
-                x, y, x + width, y + height,
-                fill=bg_color,
-                outline=""  # No outline
-            )
-            self.canvas_items.append(bg_rect)
+                # Handle hex colors
+                if bg_color.startswith('#'):
+                    # Ensure it's a valid hex color
+                    if len(bg_color) == 4:  # #RGB format
+                        r = bg_color[1] * 2
+                        g = bg_color[2] * 2
+                        b = bg_color[3] * 2
+                        bg_color = f"#{r}{g}{b}"
+                        
+                # Handle rgb() format
+                elif bg_color.startswith('rgb('):
+                    # Extract the RGB values
+                    rgb_values = bg_color[4:-1].split(',')
+                    if len(rgb_values) == 3:
+                        r = int(rgb_values[0].strip())
+                        g = int(rgb_values[1].strip())
+                        b = int(rgb_values[2].strip())
+                        bg_color = f"#{r:02x}{g:02x}{b:02x}"
+            except Exception as e:
+                logger.error(f"Error rendering background: {e}")
+                bg_color = None
+        
+        # Border sides drawn: those with a width and a style other than 'none'
+        sides = []
+        try:
+            for side in ('top', 'right', 'bottom', 'left'):
+                border_width = self._parse_size(style.get(f'border-{side}-width', '0px'))
+                if border_width > 0 and style.get(f'border-{side}-style', 'none') != 'none':
+                    sides.append((side, border_width, self._convert_color(style.get(f'border-{side}-color', 'black'))))
         except Exception as e:
-            logger = logging.getLogger(__name__)
-            logger.error(f"Error rendering background: {e}")
-            # Continue with rendering even if background fails
+            logger.error(f"Error rendering border: {e}")
+            sides = []
+        
+        plan = (bg_color, tuple(sides))
+        if key is not None:
+            self._paint_plan_cache[key] = plan
+        return plan
     
     def _safe_divide(self, a, b):
         """
@@ -2344,7 +3642,7 @@ class HTML5Renderer:
             error_icon = self.canvas.create_text(
                 70, 70,
                 text="⚠️",
-                font=("Arial", 24),
+                font=self._get_font(("Arial", 24)),
                 fill="#ff0000",
                 anchor="nw"
             )
@@ -2354,7 +3652,7 @@ class HTML5Renderer:
             error_title = self.canvas.create_text(
                 110, 70,
                 text="Rendering Error",
-                font=("Arial", 16, "bold"),
+                font=self._get_font(("Arial", 16, "bold")),
                 fill="#ff0000",
                 anchor="nw"
             )
@@ -2364,7 +3662,7 @@ class HTML5Renderer:
             error_text = self.canvas.create_text(
                 70, 100,
                 text=message,
-                font=("Arial", 12),
+                font=self._get_font(("Arial", 12)),
                 fill="#000000",
                 anchor="nw",
                 width=self.viewport_width - 140
@@ -2375,7 +3673,7 @@ class HTML5Renderer:
             suggestion = self.canvas.create_text(
                 70, 130,
                 text="Try refreshing the page or check the console for more details.",
-                font=("Arial", 10, "italic"),
+                font=self._get_font(("Arial", 10, "italic")),
                 fill="#666666",
                 anchor="nw"
             )
@@ -2542,7 +3840,7 @@ class HTML5Renderer:
         title_text = self.canvas.create_text(
             x, y, 
             text=title,
-            font=("Arial", 16, "bold"),
+            font=self._get_font(("Arial", 16, "bold")),
             anchor="nw",
             fill="#000000"
         )
@@ -2555,10 +3853,11 @@ class HTML5Renderer:
         content_text = self.canvas.create_text(
             x, y, 
             text=text_content[:5000],  # Limit text to avoid performance issues
-            font=("Arial", 12),
+            font=self._get_font(("Arial", 12)),
             anchor="nw",
             fill="#000000",
-            width=self.viewport_width - 40  # Allow wrapping
+            width=self.viewport_width - 40,  # Allow wrapping
+            tags='text'  # Rewrapped when zooming
         )
         self.canvas_items.append(content_text)
         
@@ -2576,14 +3875,12 @@ class HTML5Renderer:
             width: Width of the element
             height: Height of the element
         """
-        # Create a horizontal line
-        line = self.canvas.create_line(
-            x, y + height // 2, 
-            x + width, y + height // 2,
+        # Queue a horizontal line
+        self._queue_draw(
+            'line', (x, y + height // 2, x + width, y + height // 2),
             fill="#cccccc",
             width=1
         )
-        self.canvas_items.append(line)
         
     def _make_link_clickable(self, layout_box: LayoutBox, x: int, y: int, width: int, height: int) -> None:
         """
@@ -2602,7 +3899,8 @@ class HTML5Renderer:
         # Create a unique identifier for this element to check if already processed
         element_id = f"{id(layout_box.element)}"
         if element_id in self.processed_nodes:
-            logger.debug(f"Skipping already processed link element: {element_id}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Skipping already processed link element: {element_id}")
             return
             
         # Get the href attribute
@@ -2619,7 +3917,8 @@ class HTML5Renderer:
             
             # Check if parent has been rendered with paragraph style
             if parent_id in self.processed_rendered_paragraphs:
-                logger.debug(f"Skipping link in already rendered paragraph: {element_id}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Skipping link in already rendered paragraph: {element_id}")
                 self.processed_nodes.add(element_id)
                 return
         
@@ -2627,7 +3926,8 @@ class HTML5Renderer:
         self.processed_nodes.add(element_id)
         
         # For standalone links, create a clickable text with underline using the paragraph-style approach
-        logger.debug(f"Using paragraph-style rendering for standalone link: {href}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Using paragraph-style rendering for standalone link: {href}")
         
         # Get font settings from computed style
         font_family = "Arial"
@@ -2642,27 +3942,10 @@ class HTML5Renderer:
             font_style = layout_box.computed_style.get('font-style', font_style)
             
             # Convert font size to integer
-            try:
-                if isinstance(font_size_str, str):
-                    if font_size_str.endswith('px'):
-                        font_size = int(font_size_str[:-2])
-                    else:
-                        font_size = int(font_size_str)
-                else:
-                    font_size = int(font_size_str)
-            except (ValueError, TypeError):
-                font_size = 12  # Fallback to default size
+            font_size = self._parse_font_size(font_size_str, 12)
         
         # Create base font configuration
-        base_font = (font_family, font_size)
-        
-        if font_weight == 'bold':
-            base_font = (font_family, font_size, 'bold')
-        if font_style == 'italic':
-            if len(base_font) == 2:
-                base_font = (font_family, font_size, 'italic')
-            else:
-                base_font = (font_family, font_size, 'bold italic')
+        base_font = self._style_font(font_family, font_size, font_weight, font_style)
                 
         # Add underline for links
         if len(base_font) == 2:
@@ -2671,13 +3954,7 @@ class HTML5Renderer:
             link_font = (base_font[0], base_font[1], base_font[2] + ' underline')
         
         # Get link text
-        link_text = ""
-        if hasattr(layout_box.element, 'text_content'):
-            link_text = layout_box.element.text_content
-        elif hasattr(layout_box.element, 'textContent'):
-            link_text = layout_box.element.textContent
-        elif hasattr(layout_box.element, 'text'):
-            link_text = layout_box.element.text
+        link_text = self._text(layout_box.element)
             
         # If no text content, try to get from child nodes
         if not link_text or not link_text.strip():
@@ -2693,18 +3970,15 @@ class HTML5Renderer:
         link_item = self.canvas.create_text(
             x, y,
             text=link_text,
-            font=link_font,
+            font=self._get_font(link_font),
             fill=link_color,
             anchor="nw"
         )
         self.canvas_items.append(link_item)
         
-        # Get actual text dimensions
-        bbox = self.canvas.bbox(link_item)
-        if bbox:
-            actual_width = bbox[2] - bbox[0]
-            actual_height = bbox[3] - bbox[1]
-            
+        # Measure the text from the font instead of asking Tk for the item's bbox
+        actual_width, actual_height = self._measure_text(link_font, link_text)
+        if actual_width:
             # Make link clickable
             clickable_area = self.canvas.create_rectangle(
                 x, y, 
@@ -2755,35 +4029,48 @@ class HTML5Renderer:
         if not src:
             return
             
-        # Try to get the image
-        img = self._get_image(src)
+        # Use the image if it has been loaded (and resized), otherwise load it
+        # in the background and draw a placeholder until it arrives. Only the
+        # PhotoImage upload happens on the Tk thread. The item's position is
+        # scaled to the zoom level with the rest of the canvas, but its pixels
+        # have to be resized to it.
+        zoom = self.zoom_level
+        size = (int(width * zoom), int(height * zoom))
+        img = self.image_cache.get(src)
+        if img is None:
+            self._render_pending_image(layout_box, x, y, width, height, src)
+            self._start_image_loading(src, size)
+            return
         
         if img:
             try:
                 # Convert PIL Image to PhotoImage if needed
-                if src not in self.photo_cache:
-                    # Ensure dimensions are integers
-                    width = int(width)
-                    height = int(height)
-                    
-                    # Resize image if needed
-                    if width != img.width or height != img.height:
-                        img = img.resize((width, height), Image.Resampling.LANCZOS)
+                key = (src,) + size
+                photo = self.photo_cache.get(key)
+                if photo is None:
+                    if size == (img.width, img.height):
+                        sized = img
+                    else:
+                        sized = self._sized_image_cache.get(key)
+                    if sized is None:
+                        self._render_pending_image(layout_box, x, y, width, height, src)
+                        self._start_image_resize(src, img, size)
+                        return
                     
                     # Convert to PhotoImage
-                    photo = ImageTk.PhotoImage(img)
-                    self.photo_cache[src] = photo
-                else:
-                    photo = self.photo_cache[src]
+                    photo = ImageTk.PhotoImage(sized)
+                    self.photo_cache[key] = photo
                 
                 # Create the image on the canvas
+                tag = self._tag_for(element)
                 image_item = self.canvas.create_image(
                     int(x), int(y),  # Ensure coordinates are integers
                     image=photo,
                     anchor='nw',
-                    tags=f'element:{element.id}' if hasattr(element, 'id') and element.id else ''
+                    tags=tag
                 )
                 self.canvas_items.append(image_item)
+                self._image_items[image_item] = (layout_box, x, y, width, height)
                 
                 # Add debug rectangle if enabled
                 if self.draw_debug_boxes:
@@ -2792,11 +4079,12 @@ class HTML5Renderer:
                         outline='red',
                         fill='',
                         width=1,
-                        tags=f'debug element:{element.id}' if hasattr(element, 'id') and element.id else 'debug'
+                        tags=('debug', tag) if tag else 'debug'
                     )
                     self.canvas_items.append(debug_rect)
                 
-                logger.debug(f"Rendered image: {src}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Rendered image: {src}")
                 return
                 
             except Exception as e:
@@ -2805,6 +4093,26 @@ class HTML5Renderer:
         # If we get here, show a placeholder
         self._render_image_placeholder(layout_box, int(x), int(y), int(width), int(height), element)
     
+    def _render_pending_image(self, layout_box: LayoutBox, x: int, y: int, width: int, height: int, src: str) -> None:
+        """
+        Draw a placeholder for an image that is still loading.
+        
+        The placeholder is replaced by _redraw_images once the image arrives.
+        
+        Args:
+            layout_box: The layout box for the image
+            x: X coordinate
+            y: Y coordinate
+            width: Width of the image
+            height: Height of the image
+            src: Image source URL
+        """
+        first_item = len(self.canvas_items)
+        self._render_image_placeholder(layout_box, int(x), int(y), int(width), int(height), layout_box.element)
+        self._pending_image_boxes.setdefault(src, []).append(
+            (layout_box, x, y, width, height, self.canvas_items[first_item:])
+        )
+    
     def _render_button_element(self, x, y, width, height, text, element, is_disabled=False):
         """
         Render a button element.
@@ -2818,24 +4126,25 @@ class HTML5Renderer:
             element: The button element
             is_disabled: Whether the button is disabled
         """
+        # A collapsed button has nothing to draw
+        if width <= 0 or height <= 0:
+            return
+        
         # Determine colors based on disabled state
-        if is_disabled:
-            bg_color = '#e0e0e0'
-            text_color = '#a0a0a0'
-            border_color = '#c0c0c0'
-        else:
-            bg_color = '#f0f0f0'
-            text_color = '#000000'
-            border_color = '#c0c0c0'
-            
-        # Create button with rounded corners
-        button = self.canvas.create_rectangle(
-            x, y, x + width, y + height,
+        bg_color, text_color, border_color = self.BUTTON_COLORS[bool(is_disabled)]
+        
+        # Enabled buttons get the 'button' tag, whose bindings (set up once in
+        # _init_event_bindings) show the hand cursor over the frame and label
+        tags = () if is_disabled else ('button', str(id(element)))
+        
+        # Queue the button frame with the other box decorations
+        self._queue_draw(
+            'rectangle', (x, y, x + width, y + height),
             fill=bg_color,
             outline=border_color,
-            width=1
+            width=1,
+            tags=tags
         )
-        self.canvas_items.append(button)
         
         # Add text
         text_item = self.canvas.create_text(
@@ -2843,23 +4152,10 @@ class HTML5Renderer:
             text=text,
             fill=text_color,
             anchor='center',
-            font=('Arial', 10)
+            font=self._get_font(('Arial', 10)),
+            tags=tags
         )
         self.canvas_items.append(text_item)
-        
-        # Make button clickable if not disabled
-        if not is_disabled:
-            clickable_area = self.canvas.create_rectangle(
-                x, y, x + width, y + height,
-                fill='',
-                outline='',
-                tags=('button', str(id(element)))
-            )
-            self.canvas_items.append(clickable_area)
-            
-            # Change cursor to hand when hovering over the button
-            self.canvas.tag_bind(clickable_area, '<Enter>', lambda event: self.canvas.config(cursor='hand2'))
-            self.canvas.tag_bind(clickable_area, '<Leave>', lambda event: self.canvas.config(cursor=''))
     
     def _render_border(self, layout_box: LayoutBox, x: int, y: int, width: int, height: int) -> None:
         """
@@ -2879,76 +4175,32 @@ class HTML5Renderer:
         style = layout_box.computed_style
         if not style:
             return
-            
-        # Get border properties
-        border_top_width = self._parse_size(style.get('border-top-width', '0px'))
-        border_right_width = self._parse_size(style.get('border-right-width', '0px'))
-        border_bottom_width = self._parse_size(style.get('border-bottom-width', '0px'))
-        border_left_width = self._parse_size(style.get('border-left-width', '0px'))
         
-        # If no borders, return early
-        if border_top_width == 0 and border_right_width == 0 and border_bottom_width == 0 and border_left_width == 0:
+        sides = self._paint_plan(style)[1]
+        
+        # A border that is the same on all four sides is one outlined rectangle
+        if len(sides) == 4 and len({(side_width, color) for _, side_width, color in sides}) == 1:
+            _, border_width, border_color = sides[0]
+            self._queue_draw(
+                'rectangle', (x, y, x + width, y + height),
+                outline=border_color,
+                width=border_width,
+                fill=''
+            )
             return
-            
-        # Get border colors
-        border_top_color = style.get('border-top-color', 'black')
-        border_right_color = style.get('border-right-color', 'black')
-        border_bottom_color = style.get('border-bottom-color', 'black')
-        border_left_color = style.get('border-left-color', 'black')
-        
-        # Convert colors to Tkinter format
-        border_top_color = self._convert_color(border_top_color)
-        border_right_color = self._convert_color(border_right_color)
-        border_bottom_color = self._convert_color(border_bottom_color)
-        border_left_color = self._convert_color(border_left_color)
-        
-        # Get border styles
-        border_top_style = style.get('border-top-style', 'none')
-        border_right_style = style.get('border-right-style', 'none')
-        border_bottom_style = style.get('border-bottom-style', 'none')
-        border_left_style = style.get('border-left-style', 'none')
-        
-        # Draw borders if they have width and are not 'none'
-        try:
-            # Top border
-            if border_top_width > 0 and border_top_style != 'none':
-                top_border = self.canvas.create_line(
-                    x, y, x + width, y,
-                    width=border_top_width,
-                    fill=border_top_color
-                )
-                self.canvas_items.append(top_border)
-                
-            # Right border
-            if border_right_width > 0 and border_right_style != 'none':
-                right_border = self.canvas.create_line(
-                    x + width, y, x + width, y + height,
-                    width=border_right_width,
-                    fill=border_right_color
-                )
-                self.canvas_items.append(right_border)
-                
-            # Bottom border
-            if border_bottom_width > 0 and border_bottom_style != 'none':
-                bottom_border = self.canvas.create_line(
-                    x, y + height, x + width, y + height,
-                    width=border_bottom_width,
-                    fill=border_bottom_color
-                )
-                self.canvas_items.append(bottom_border)
-                
-            # Left border
-            if border_left_width > 0 and border_left_style != 'none':
-                left_border = self.canvas.create_line(
-                    x, y, x, y + height,
-                    width=border_left_width,
-                    fill=border_left_color
-                )
-                self.canvas_items.append(left_border)
-        except Exception as e:
-            logger = logging.getLogger(__name__)
-            logger.error(f"Error rendering border: {e}")
-            # Continue with rendering even if border fails
+        
+        # Draw the border sides resolved for this style
+        queue_draw = self._queue_draw
+        for side, border_width, border_color in sides:
+            if side == 'top':
+                coords = (x, y, x + width, y)
+            elif side == 'right':
+                coords = (x + width, y, x + width, y + height)
+            elif side == 'bottom':
+                coords = (x, y + height, x + width, y + height)
+            else:
+                coords = (x, y, x, y + height)
+            queue_draw('line', coords, width=border_width, fill=border_color)
     
     def _convert_color(self, color: str) -> str:
         """
@@ -3156,7 +4408,7 @@ class HTML5Renderer:
             element = layout_box.element
             
             # Skip script and style tags
-            if hasattr(element, 'tag_name') and element.tag_name.lower() in ('script', 'style'):
+            if self._tag_name_of(element) in self.NON_RENDERED_TAGS:
                 return
                 
             # Create a unique identifier for this element
@@ -3171,45 +4423,28 @@ class HTML5Renderer:
             
             # Special handling for link elements - always use paragraph-style rendering
             if hasattr(element, 'tag_name') and element.tag_name.lower() == 'a':
-                logger.debug(f"Using paragraph-style rendering for link element: {element.tag_name}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Using paragraph-style rendering for link element: {element.tag_name}")
                 # Create a temporary paragraph-like layout box to render this link
                 self._render_paragraph_with_links(layout_box)
                 return
             
             # Check if this is a container that might contain inline links
-            if hasattr(element, 'tag_name') and element.tag_name.lower() in ('p', 'div', 'span', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li') and hasattr(element, 'child_nodes'):
+            if self._tag_name_of(element) in self.TEXT_CONTAINER_TAGS:
                 # Check if container has links or other inline elements
-                has_links = False
-                has_text = False
-                has_other_inline = False
-                
-                for child in element.child_nodes:
-                    if hasattr(child, 'tag_name'):
-                        tag = child.tag_name.lower()
-                        if tag == 'a':
-                            has_links = True
-                        elif tag in ('span', 'em', 'strong', 'b', 'i', 'u', 'code', 'small', 'big', 'sub', 'sup'):
-                            has_other_inline = True
-                    elif hasattr(child, 'node_type') and child.node_type == 3:  # Text node
-                        if hasattr(child, 'node_value') and child.node_value and child.node_value.strip():
-                            has_text = True
+                has_links, has_text, has_other_inline = self._child_summary(element)
                 
                 # Use paragraph-style rendering for mixed content or whenever there's a link
                 if has_links:  # Simplified condition - always use paragraph style if there are links
-                    logger.debug(f"Using paragraph-style rendering for content with links in {element.tag_name}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Using paragraph-style rendering for content with links in {element.tag_name}")
                     self._render_paragraph_with_links(layout_box)
                     return
             
             # Standard text rendering for elements without inline links
             
             # Get text content
-            text = None
-            if hasattr(element, 'text_content'):
-                text = element.text_content
-            elif hasattr(element, 'textContent'):
-                text = element.textContent
-            elif hasattr(element, 'text'):
-                text = element.text
+            text = self._text(element)
                 
             if not text:
                 # Try to get text from child nodes
@@ -3235,32 +4470,19 @@ class HTML5Renderer:
                 font_style = layout_box.computed_style.get('font-style', font_style)
                 
                 # Convert font size to integer
-                try:
-                    if isinstance(font_size_str, str):
-                        if font_size_str.endswith('px'):
-                            font_size = int(font_size_str[:-2])
-                        else:
-                            font_size = int(font_size_str)
-                    else:
-                        font_size = int(font_size_str)
-                except (ValueError, TypeError):
-                    font_size = 12  # Fallback to default size
+                font_size = self._parse_font_size(font_size_str, 12)
             
             # Create font configuration
-            font_config = (font_family, font_size)
+            font_config = self._style_font(font_family, font_size, font_weight, font_style)
             
-            if font_weight == 'bold':
-                font_config = (font_family, font_size, 'bold')
-            if font_style == 'italic':
-                if len(font_config) == 2:
-                    font_config = (font_family, font_size, 'italic')
-                else:
-                    font_config = (font_family, font_size, 'bold italic')
-            
-            # Text color from computed style
+            # Text color and alignment from computed style
             color = "#000000"
+            justify = 'left'
             if hasattr(layout_box, 'computed_style'):
                 color = layout_box.computed_style.get('color', color)
+                text_align = layout_box.computed_style.get('text-align')
+                if text_align:
+                    justify = self.TEXT_ALIGN_JUSTIFY.get(str(text_align).strip().lower(), 'left')
             
             # Get element tag for specific adjustments
             tag_name = element.tag_name.lower() if hasattr(element, 'tag_name') else ''
@@ -3282,10 +4504,11 @@ class HTML5Renderer:
             text_item = self.canvas.create_text(
                 x, y,
                 text=text.strip(),
-                font=font_config,
+                font=self._get_font(font_config),
                 fill=color,
                 anchor="nw",
                 width=available_width,
+                justify=justify,
                 tags=("text", tag_name)  # Add tags for better management
             )
             
@@ -3318,14 +4541,16 @@ class HTML5Renderer:
             
             # Skip if the element has already been processed
             if element_id in self.processed_rendered_paragraphs:
-                logger.debug(f"Skipping already rendered paragraph with links: {element_id}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Skipping already rendered paragraph with links: {element_id}")
                 return
                 
             # Mark this paragraph as being rendered (to avoid duplicate rendering of child links)
             self.in_progress_paragraphs.add(element_id)
             
             element_tag = element.tag_name.lower() if hasattr(element, 'tag_name') else 'unknown'
-            logger.debug(f"Rendering with paragraph-style links: {element_tag}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Rendering with paragraph-style links: {element_tag}")
             
             # Get paragraph position and dimensions
             x = layout_box.box_metrics.x + layout_box.box_metrics.padding_left + layout_box.box_metrics.border_left_width
@@ -3358,16 +4583,7 @@ class HTML5Renderer:
                 font_style = layout_box.computed_style.get('font-style', font_style)
                 
                 # Convert font size to integer
-                try:
-                    if isinstance(font_size_str, str):
-                        if font_size_str.endswith('px'):
-                            font_size = int(font_size_str[:-2])
-                        else:
-                            font_size = int(font_size_str)
-                    else:
-                        font_size = int(font_size_str)
-                except (ValueError, TypeError):
-                    font_size = 12  # Fallback to default size
+                font_size = self._parse_font_size(font_size_str, 12)
             
             # Text color from computed style
             default_color = "#000000"
@@ -3375,20 +4591,12 @@ class HTML5Renderer:
                 default_color = layout_box.computed_style.get('color', default_color)
             
             # Create font configuration
-            base_font = (font_family, font_size)
-            
-            if font_weight == 'bold':
-                base_font = (font_family, font_size, 'bold')
-            if font_style == 'italic':
-                if len(base_font) == 2:
-                    base_font = (font_family, font_size, 'italic')
-                else:
-                    base_font = (font_family, font_size, 'bold italic')
+            base_font = self._style_font(font_family, font_size, font_weight, font_style)
             
             # Track current position for text flow
             current_x = x
             current_y = y
-            line_height = font_size * 1.2  # Estimate line height
+            line_height = self._get_linespace(base_font)
             max_width = available_width if available_width else self.viewport_width - x - 20
             current_line_width = 0
             
@@ -3400,13 +4608,7 @@ class HTML5Renderer:
                 href = element.get_attribute('href') if hasattr(element, 'get_attribute') else None
                 if href:
                     # Get link text
-                    link_text = ""
-                    if hasattr(element, 'text_content'):
-                        link_text = element.text_content
-                    elif hasattr(element, 'textContent'):
-                        link_text = element.textContent
-                    elif hasattr(element, 'text'):
-                        link_text = element.text
+                    link_text = self._text(element)
                         
                     # If no text content, try to get from child nodes
                     if not link_text or not link_text.strip():
@@ -3429,18 +4631,15 @@ class HTML5Renderer:
                     link_item = self.canvas.create_text(
                         current_x, current_y,
                         text=link_text,
-                        font=link_font,
+                        font=self._get_font(link_font),
                         fill=link_color,
                         anchor="nw"
                     )
                     self.canvas_items.append(link_item)
                     
-                    # Get actual text dimensions
-                    bbox = self.canvas.bbox(link_item)
-                    if bbox:
-                        actual_width = bbox[2] - bbox[0]
-                        actual_height = bbox[3] - bbox[1]
-                        
+                    # Measure the text from the font instead of asking Tk for the item's bbox
+                    actual_width, actual_height = self._measure_text(link_font, link_text)
+                    if actual_width:
                         # Make link clickable
                         clickable_area = self.canvas.create_rectangle(
                             current_x, current_y, 
@@ -3472,16 +4671,25 @@ class HTML5Renderer:
             # Set to keep track of rendered link IDs within this paragraph
             rendered_links = set()
             
+            # Canvas methods used for every child, looked up once
+            create_text = self.canvas.create_text
+            create_rectangle = self.canvas.create_rectangle
+            tag_bind = self.canvas.tag_bind
+            add_item = self.canvas_items.append
+            
             # Process mixed content for container elements
-            for child in element.child_nodes if hasattr(element, 'child_nodes') else []:
+            for child in getattr(element, 'child_nodes', None) or ():
+                child_tag = self._tag_name_of(child)
+                
                 # Handle link elements
-                if hasattr(child, 'tag_name') and child.tag_name.lower() == 'a':
+                if child_tag == 'a':
                     # Create a unique ID for this link
                     link_id = f"{id(child)}"
                     
                     # Skip if this link has already been rendered
                     if link_id in rendered_links:
-                        logger.debug(f"Skipping already rendered link in paragraph: {link_id}")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Skipping already rendered link in paragraph: {link_id}")
                         continue
                     
                     # Mark this link as rendered within this paragraph
@@ -3491,13 +4699,7 @@ class HTML5Renderer:
                     self.processed_nodes.add(link_id)
                     
                     # Get link text and href
-                    link_text = ""
-                    if hasattr(child, 'text_content'):
-                        link_text = child.text_content
-                    elif hasattr(child, 'textContent'):
-                        link_text = child.textContent
-                    elif hasattr(child, 'text'):
-                        link_text = child.text
+                    link_text = self._text(child)
                     
                     # If no direct text, try to extract from child nodes
                     if not link_text or not link_text.strip():
@@ -3505,7 +4707,8 @@ class HTML5Renderer:
                     
                     href = child.get_attribute('href') if hasattr(child, 'get_attribute') else ""
                     
-                    logger.debug(f"Rendering link in paragraph: {link_text} -> {href}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Rendering link in paragraph: {link_text} -> {href}")
                     
                     if not link_text.strip():
                         continue
@@ -3522,28 +4725,11 @@ class HTML5Renderer:
                     link_font_weight = link_style.get('font-weight', font_weight)
                     link_font_style = link_style.get('font-style', font_style)
                     
-                    # Convert link font size to integer
-                    try:
-                        if isinstance(link_font_size_str, str):
-                            if link_font_size_str.endswith('px'):
-                                link_font_size = int(link_font_size_str[:-2])
-                            else:
-                                link_font_size = int(link_font_size_str)
-                        else:
-                            link_font_size = int(link_font_size_str)
-                    except (ValueError, TypeError):
-                        link_font_size = font_size  # Use parent font size as fallback
+                    # Convert link font size to integer, falling back to the parent size
+                    link_font_size = self._parse_font_size(link_font_size_str, font_size)
                     
                     # Build link font
-                    link_font = (link_font_family, link_font_size)
-                    
-                    if link_font_weight == 'bold':
-                        link_font = (link_font_family, link_font_size, 'bold')
-                    if link_font_style == 'italic':
-                        if len(link_font) == 2:
-                            link_font = (link_font_family, link_font_size, 'italic')
-                        else:
-                            link_font = (link_font_family, link_font_size, 'bold italic')
+                    link_font = self._style_font(link_font_family, link_font_size, link_font_weight, link_font_style)
                     
                     # Estimate text width (rough approximation)
                     char_width = link_font_size * 0.6  # Average character width
@@ -3568,44 +4754,41 @@ class HTML5Renderer:
                         link_font = (link_font[0], link_font[1], link_font[2] + ' underline')
                     
                     # Render link text
-                    link_item = self.canvas.create_text(
+                    link_item = create_text(
                         current_x, current_y,
                         text=link_text,
-                        font=link_font,
+                        font=self._get_font(link_font),
                         fill=link_color,
                         anchor="nw"
                     )
-                    self.canvas_items.append(link_item)
+                    add_item(link_item)
                     
-                    # Get actual text dimensions
-                    bbox = self.canvas.bbox(link_item)
-                    if bbox:
-                        actual_width = bbox[2] - bbox[0]
-                        actual_height = bbox[3] - bbox[1]
-                        
+                    # Measure the text from the font instead of asking Tk for the item's bbox
+                    actual_width, actual_height = self._measure_text(link_font, link_text)
+                    if actual_width:
                         # Make link clickable
-                        clickable_area = self.canvas.create_rectangle(
+                        clickable_area = create_rectangle(
                             current_x, current_y, 
                             current_x + actual_width, current_y + actual_height,
                             fill='',
                             outline='',
                             tags=('link', href)
                         )
-                        self.canvas_items.append(clickable_area)
+                        add_item(clickable_area)
                         
                         # Bind click event
-                        self.canvas.tag_bind(clickable_area, '<Button-1>', 
+                        tag_bind(clickable_area, '<Button-1>', 
                                              lambda event, url=href: self._on_link_click(event, url))
-                        self.canvas.tag_bind(clickable_area, '<Enter>', 
+                        tag_bind(clickable_area, '<Enter>', 
                                              lambda event: self.canvas.config(cursor='hand2'))
-                        self.canvas.tag_bind(clickable_area, '<Leave>', 
+                        tag_bind(clickable_area, '<Leave>', 
                                              lambda event: self.canvas.config(cursor=''))
                         # Update position for next element
                         current_x += actual_width
                         current_line_width += actual_width
                         line_height = max(line_height, actual_height)
                     else:
-                        # Fallback if we couldn't get bbox
+                        # Fallback if the text couldn't be measured
                         current_x += text_width
                         current_line_width += text_width
                 
@@ -3617,54 +4800,40 @@ class HTML5Renderer:
                         if not text:
                             continue
                         
-                        # Estimate text width
-                        char_width = font_size * 0.6
-                        text_width = len(text) * char_width
-                        
-                        # Check if we need to wrap to next line
-                        if current_line_width + text_width > max_width:
-                            current_x = x
-                            current_y += line_height
-                            current_line_width = 0
-                        
-                        # Create text item
-                        text_item = self.canvas.create_text(
-                            current_x, current_y,
-                            text=text,
-                            font=base_font,
-                            fill=default_color,
-                            anchor="nw"
-                        )
-                        self.canvas_items.append(text_item)
-                        
-                        # Get actual text dimensions
-                        bbox = self.canvas.bbox(text_item)
-                        if bbox:
-                            actual_width = bbox[2] - bbox[0]
-                            actual_height = bbox[3] - bbox[1]
+                        # Break the text into lines that fit the rest of the
+                        # current line and then the full width
+                        lines = self._break_text(base_font, text, max_width - current_line_width, max_width)
+                        for line_index, line in enumerate(lines):
+                            if line_index > 0:
+                                current_x = x
+                                current_y += line_height
+                                current_line_width = 0
+                            if not line:
+                                continue
+                            
+                            # Create text item
+                            text_item = create_text(
+                                current_x, current_y,
+                                text=line,
+                                font=self._get_font(base_font),
+                                fill=default_color,
+                                anchor="nw"
+                            )
+                            add_item(text_item)
                             
-                            # Update position for next element
+                            # Measure the text from the font instead of asking Tk for the item's bbox
+                            actual_width, actual_height = self._measure_text(base_font, line)
                             current_x += actual_width
                             current_line_width += actual_width
                             line_height = max(line_height, actual_height)
-                        else:
-                            # Fallback if we couldn't get bbox
-                            current_x += text_width
-                            current_line_width += text_width
                 
                 # Handle other inline elements
-                elif hasattr(child, 'tag_name'):
+                elif child_tag:
                     # Handle other inline elements by rendering them at the current position
-                    tag_name = child.tag_name.lower()
+                    tag_name = child_tag
                     
                     # Get text from this inline element
-                    text = ""
-                    if hasattr(child, 'text_content'):
-                        text = child.text_content
-                    elif hasattr(child, 'textContent'):
-                        text = child.textContent
-                    elif hasattr(child, 'text'):
-                        text = child.text
+                    text = self._text(child)
                     
                     # If no direct text, try to extract from child nodes
                     if not text or not text.strip():
@@ -3685,17 +4854,8 @@ class HTML5Renderer:
                     inline_font_weight = elem_style.get('font-weight', font_weight)
                     inline_font_style = elem_style.get('font-style', font_style)
                     
-                    # Convert inline font size to integer
-                    try:
-                        if isinstance(inline_font_size_str, str):
-                            if inline_font_size_str.endswith('px'):
-                                inline_font_size = int(inline_font_size_str[:-2])
-                            else:
-                                inline_font_size = int(inline_font_size_str)
-                        else:
-                            inline_font_size = int(inline_font_size_str)
-                    except (ValueError, TypeError):
-                        inline_font_size = font_size  # Use parent font size as fallback
+                    # Convert inline font size to integer, falling back to the parent size
+                    inline_font_size = self._parse_font_size(inline_font_size_str, font_size)
                     
                     # Build inline element font
                     inline_font = (inline_font_family, inline_font_size)
@@ -3740,27 +4900,24 @@ class HTML5Renderer:
                         text_color = elem_style.get('color')
                     
                     # Create text item
-                    text_item = self.canvas.create_text(
+                    text_item = create_text(
                         current_x, current_y,
                         text=text,
-                        font=inline_font,
+                        font=self._get_font(inline_font),
                         fill=text_color,
                         anchor="nw"
                     )
-                    self.canvas_items.append(text_item)
+                    add_item(text_item)
                     
-                    # Get actual text dimensions
-                    bbox = self.canvas.bbox(text_item)
-                    if bbox:
-                        actual_width = bbox[2] - bbox[0]
-                        actual_height = bbox[3] - bbox[1]
-                        
+                    # Measure the text from the font instead of asking Tk for the item's bbox
+                    actual_width, actual_height = self._measure_text(inline_font, text)
+                    if actual_width:
                         # Update position for next element
                         current_x += actual_width
                         current_line_width += actual_width
                         line_height = max(line_height, actual_height)
                     else:
-                        # Fallback if we couldn't get bbox
+                        # Fallback if the text couldn't be measured
                         current_x += text_width
                         current_line_width += text_width
             
@@ -3794,13 +4951,7 @@ class HTML5Renderer:
             element = layout_box.element
             
             # Get text content
-            text = None
-            if hasattr(element, 'text_content'):
-                text = element.text_content
-            elif hasattr(element, 'textContent'):
-                text = element.textContent
-            elif hasattr(element, 'text'):
-                text = element.text
+            text = self._text(element)
                 
             if not text:
                 # Try to get text from child nodes
@@ -3830,7 +4981,7 @@ class HTML5Renderer:
             text_item = self.canvas.create_text(
                 x, y,
                 text=text.strip(),
-                font=(font_family, font_size),
+                font=self._get_font((font_family, font_size)),
                 fill="#000000",
                 anchor="nw",
                 width=available_width if available_width > 0 else None
@@ -3841,47 +4992,69 @@ class HTML5Renderer:
         except Exception as e:
             logger.error(f"Error in fallback text rendering: {e}")
     
+    def _draw_image_icon(self, cx, cy, tags):
+        """
+        Draw a small picture icon (frame and mountain) centred on a point.
+        
+        Plain shapes avoid the font fallback and glyph shaping Tk needs to
+        draw an emoji.
+        
+        Args:
+            cx: X coordinate of the icon centre
+            cy: Y coordinate of the icon centre
+            tags: Canvas tags for the icon items
+            
+        Returns:
+            List of the created canvas item IDs
+        """
+        frame = self.canvas.create_rectangle(
+            cx - 9, cy - 7, cx + 9, cy + 7,
+            outline='#999999',
+            tags=tags
+        )
+        mountain = self.canvas.create_polygon(
+            cx - 7, cy + 5, cx - 2, cy - 2, cx + 1, cy + 2, cx + 3, cy, cx + 7, cy + 5,
+            fill='#999999',
+            outline='',
+            tags=tags
+        )
+        return [frame, mountain]
+    
     def _render_image_placeholder(self, layout_box, x, y, width, height, element):
         """Render a placeholder while the image is loading."""
+        item_ids = []
         try:
+            tags = (self._tag_for(element), f'loading_{element.get_attribute("src")}')
+            create_text = self.canvas.create_text
+            
             # Create placeholder rectangle
-            placeholder = self.canvas.create_rectangle(
+            item_ids.append(self.canvas.create_rectangle(
                 x, y, x + width, y + height,
                 outline='#CCCCCC',
                 fill='#EEEEEE',
-                tags=(f'element:{element.id}' if hasattr(element, 'id') and element.id else '',
-                      f'loading_{element.get_attribute("src")}')
-            )
-            self.canvas_items.append(placeholder)
+                tags=tags
+            ))
             
             # Add loading indicator
-            label = self.canvas.create_text(
-                x + width/2, y + height/2,
-                text="🖼️",
-                font=(self.fonts['default'][0], 14),
-                fill='#999999',
-                tags=(f'element:{element.id}' if hasattr(element, 'id') and element.id else '',
-                      f'loading_{element.get_attribute("src")}')
-            )
-            self.canvas_items.append(label)
+            item_ids.extend(self._draw_image_icon(x + width // 2, y + height // 2, tags))
             
             # If alt text is available, display it below the icon
             if hasattr(element, 'get_attribute'):
                 alt_text = element.get_attribute('alt')
                 if alt_text:
-                    alt_label = self.canvas.create_text(
-                        x + width/2, y + height/2 + 20,
+                    item_ids.append(create_text(
+                        x + width // 2, y + height // 2 + 20,
                         text=alt_text,
-                        font=(self.fonts['default'][0], 10),
+                        font=self._get_font((self.fonts['default'][0], 10)),
                         fill='#666666',
-                        tags=(f'element:{element.id}' if hasattr(element, 'id') and element.id else '',
-                              f'loading_{element.get_attribute("src")}')
-                    )
-                    self.canvas_items.append(alt_label)
+                        tags=tags
+                    ))
                     
             logger.debug(f"Rendered image placeholder at ({x}, {y}) with dimensions {width}x{height}")
         except Exception as e:
             logger.error(f"Error rendering image placeholder: {e}")
+        finally:
+            self.canvas_items.extend(item_ids)
 
     def _render_form_element(self, layout_box: LayoutBox, x: int, y: int, width: int, height: int) -> None:
         """
@@ -3894,6 +5067,10 @@ class HTML5Renderer:
             width: Width of the element
             height: Height of the element
         """
+        # Collapsed controls produce no visible items
+        if width <= 0 or height <= 0:
+            return
+        
         try:
             element = layout_box.element
             if not element or not hasattr(element, 'tag_name'):
@@ -3912,20 +5089,19 @@ class HTML5Renderer:
                 element_value = ''
                 
             if tag_name == 'input':
-                if element_type in ['text', 'password', 'email', 'number', 'tel', 'url', None]:
+                if element_type in self.TEXT_INPUT_TYPES:
                     # Create a text input
-                    input_rect = self.canvas.create_rectangle(
-                        x, y, x + width, y + height,
+                    self._queue_draw(
+                        'rectangle', (x, y, x + width, y + height),
                         outline="#cccccc",
                         fill="#ffffff"
                     )
-                    self.canvas_items.append(input_rect)
                     
                     # Add text content
                     text_item = self.canvas.create_text(
-                        x + 5, y + height/2,
+                        x + 5, y + height // 2,
                         text=element_value,
-                        font=("Arial", 12),
+                        font=self._get_font(("Arial", 12)),
                         fill="#333333",
                         anchor="w"
                     )
@@ -3934,24 +5110,28 @@ class HTML5Renderer:
                 elif element_type == 'checkbox':
                     # Create checkbox
                     checkbox_size = min(16, height)
-                    checkbox = self.canvas.create_rectangle(
-                        x, y + (height - checkbox_size)/2,
-                        x + checkbox_size, y + (height + checkbox_size)/2,
+                    self._queue_draw(
+                        'rectangle', (x, y + (height - checkbox_size) // 2,
+                                      x + checkbox_size, y + (height + checkbox_size) // 2),
                         outline="#333333",
                         fill="#ffffff"
                     )
-                    self.canvas_items.append(checkbox)
                     
                     # Add label if there's text
                     if element_value:
                         label = self.canvas.create_text(
-                            x + checkbox_size + 5, y + height/2,
+                            x + checkbox_size + 5, y + height // 2,
                             text=element_value,
-                            font=("Arial", 12),
+                            font=self._get_font(("Arial", 12)),
                             fill="#333333",
                             anchor="w"
                         )
                         self.canvas_items.append(label)
+                
+                elif element_type in self.BUTTON_INPUT_TYPES:
+                    # <input type="submit|reset|button"> draws like a <button>
+                    default_label = {'submit': 'Submit', 'reset': 'Reset'}.get(element_type, '')
+                    self._render_button_element(x, y, width, height, element_value or default_label, element)
             
             elif tag_name == 'button':
                 self._render_button_element(x, y, width, height, element_value or "Button", element)
@@ -7,8 +7,9 @@ import logging
 import os
 import tempfile
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 import time
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Optional, Any, Set, Tuple
 import urllib.request
 import urllib.parse
 from pathlib import Path
@@ -33,6 +34,9 @@ logger = logging.getLogger(__name__)
 class MediaHandler:
     """Handler for media elements (images, audio, video)."""
     
+    # Number of worker threads shared by all media downloads
+    MAX_WORKERS = 4
+    
     def __init__(self, enabled: bool = True, cache_dir: Optional[str] = None):
         """
         Initialize the media handler.
@@ -51,8 +55,14 @@ class MediaHandler:
         os.makedirs(cache_dir, exist_ok=True)
         self.cache_dir = cache_dir
         
-        # Keep track of active threads
-        self.active_threads: List[threading.Thread] = []
+        # Downloads share a bounded pool of workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.MAX_WORKERS,
+            thread_name_prefix='media-loader'
+        )
+        
+        # Downloads that are queued or running, so clean_up can cancel them
+        self._futures: Set[Future] = set()
         
         # Cache of loaded images
         self.image_cache: Dict[str, Any] = {}
@@ -129,14 +139,8 @@ class MediaHandler:
                 # Mark as downloading
                 self.ongoing_downloads[url] = [callback] if callback else []
         
-        # Start download thread
-        download_thread = threading.Thread(
-            target=self._load_image_thread,
-            args=(url, callback),
-            daemon=True
-        )
-        download_thread.start()
-        self.active_threads.append(download_thread)
+        # Start the download on a worker
+        self._submit(self._load_image_thread, url, callback)
         
         return None
     
@@ -229,13 +233,8 @@ class MediaHandler:
                 callback(url, self.loaded_media[url])
             return self.loaded_media[url]
         
-        # Start a background thread to load the video
-        thread = threading.Thread(
-            target=self._load_video_thread,
-            args=(url, callback),
-            daemon=True
-        )
-        thread.start()
+        # Load the video on a worker
+        self._submit(self._load_video_thread, url, callback)
         
         return None
     
@@ -301,13 +300,8 @@ class MediaHandler:
                 callback(url, self.loaded_media[url])
             return self.loaded_media[url]
         
-        # Start a background thread to load the audio
-        thread = threading.Thread(
-            target=self._load_audio_thread,
-            args=(url, callback),
-            daemon=True
-        )
-        thread.start()
+        # Load the audio on a worker
+        self._submit(self._load_audio_thread, url, callback)
         
         return None
     
@@ -643,9 +637,27 @@ class MediaHandler:
         except Exception as e:
             logger.error(f"Error clearing media cache: {e}")
     
+    def _submit(self, fn, *args) -> None:
+        """
+        Run a download on the worker pool.
+        
+        Args:
+            fn: The download function
+            *args: Arguments for the function
+        """
+        future = self._executor.submit(fn, *args)
+        self._futures.add(future)
+        future.add_done_callback(self._futures.discard)
+    
     def clean_up(self) -> None:
         """Clean up resources used by the media handler."""
         try:
+            # Drop queued downloads and let running ones finish
+            # (shutdown's cancel_futures needs Python 3.9)
+            for future in list(self._futures):
+                future.cancel()
+            self._executor.shutdown(wait=False)
+            
             # Clear the loaded media dictionary
             with self._lock:
                 self.loaded_media.clear()
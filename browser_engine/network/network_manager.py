@@ -5,6 +5,8 @@ This module handles network requests, caching, cookies, and connection managemen
 
 import os
 import logging
+import threading
+import weakref
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -52,17 +54,39 @@ class NetworkManager:
         self.cache_dir = os.path.expanduser("~/.wink_browser/cache")
         os.makedirs(self.cache_dir, exist_ok=True)
         
-        # Cookie jar
+        # Cookie jar shared by all sessions
         self.cookie_jar = requests.cookies.RequestsCookieJar()
         
-        # Create a session for reusing connections
-        self.session = self._create_session()
+        # Sessions for reusing connections, one per thread: requests.Session
+        # is not thread-safe and get() changes the session's cookies, while
+        # the renderer fetches images from several worker threads. Each
+        # session has its own cookie jar, synced with cookie_jar under
+        # _cookie_lock.
+        self._thread_sessions = threading.local()
+        self._sessions = weakref.WeakSet()
+        self._cookie_lock = threading.Lock()
         
         # Mark as initialized
         self._initialized = True
         
         logger.info("Network manager initialized")
     
+    @property
+    def session(self) -> requests.Session:
+        """
+        Get the requests session of the calling thread.
+        
+        Returns:
+            The calling thread's session, created on first use
+        """
+        session = getattr(self._thread_sessions, 'session', None)
+        if session is None:
+            session = self._create_session()
+            self._thread_sessions.session = session
+            with self._cookie_lock:
+                self._sessions.add(session)
+        return session
+    
     def _create_session(self) -> requests.Session:
         """
         Create a new requests session with appropriate configuration.
@@ -109,7 +133,7 @@ class NetworkManager:
         
         # Set cookies
         if not self.config_manager.private_mode:
-            session.cookies = self.cookie_jar
+            self._load_cookies(session)
         
         # Set Do Not Track header if enabled
         if self.config_manager.get_config("privacy.do_not_track", True):
@@ -122,6 +146,26 @@ class NetworkManager:
         
         return session
     
+    def _load_cookies(self, session: requests.Session) -> None:
+        """
+        Copy the shared cookie jar into a session's own jar.
+        
+        Args:
+            session: The requests session to update
+        """
+        with self._cookie_lock:
+            session.cookies.update(self.cookie_jar)
+    
+    def _save_cookies(self, cookies: requests.cookies.RequestsCookieJar) -> None:
+        """
+        Merge cookies received by one session into the shared cookie jar.
+        
+        Args:
+            cookies: The cookies to merge
+        """
+        with self._cookie_lock:
+            self.cookie_jar.update(cookies)
+    
     def _configure_proxy(self, session: requests.Session) -> None:
         """
         Configure proxy settings for the session.
@@ -246,12 +290,16 @@ class NetworkManager:
             
             # For Cloudflare sites, always send cookies
             self.session.cookies.clear()
-            self.session.cookies.update(self.cookie_jar)
+            self._load_cookies(self.session)
         
         # If private mode, don't send cookies (except for Cloudflare sites)
         elif self.config_manager.private_mode:
             self.session.cookies.clear()
         
+        # Send cookies saved by other threads' sessions too
+        else:
+            self._load_cookies(self.session)
+        
         # Set special options for Cloudflare
         cloudflare_options = {}
         if "cloudflare.com" in url or any(domain in url for domain in self._known_cloudflare_sites()):
@@ -274,7 +322,7 @@ class NetworkManager:
             
             # Save cookies if not in private mode or if Cloudflare site
             if not self.config_manager.private_mode or "cloudflare.com" in url or any(domain in url for domain in self._known_cloudflare_sites()):
-                self.cookie_jar.update(response.cookies)
+                self._save_cookies(response.cookies)
                 
             # Handle Cloudflare server-side redirects
             if response.status_code in (503, 403) and ('cloudflare' in response.text.lower() or 'cf-ray' in response.headers):
@@ -323,6 +371,8 @@ class NetworkManager:
         # If private mode, don't send cookies
         if self.config_manager.private_mode:
             self.session.cookies.clear()
+        else:
+            self._load_cookies(self.session)
         
         # Perform the request
         response = self.session.post(
@@ -337,14 +387,16 @@ class NetworkManager:
         
         # Save cookies if not in private mode
         if not self.config_manager.private_mode:
-            self.cookie_jar.update(response.cookies)
+            self._save_cookies(response.cookies)
         
         return response
     
     def clear_cookies(self) -> None:
-        """Clear all cookies."""
-        self.cookie_jar.clear()
-        self.session.cookies.clear()
+        """Clear all cookies, including those of every thread's session."""
+        with self._cookie_lock:
+            self.cookie_jar.clear()
+            for session in self._sessions:
+                session.cookies.clear()
     
     def clear_cache(self) -> None:
         """Clear the browser cache."""
@@ -671,17 +671,14 @@ class BrowserWindow:
     def _zoom_in(self) -> None:
         """Zoom in the page view."""
         self.renderer.zoom_in()
-        self._update_renderer()
     
     def _zoom_out(self) -> None:
         """Zoom out the page view."""
         self.renderer.zoom_out()
-        self._update_renderer()
     
     def _zoom_reset(self) -> None:
         """Reset zoom to default level."""
         self.renderer.zoom_reset()
-        self._update_renderer()
     
     def _view_source(self) -> None:
         """View the source code of the current page."""
@@ -703,10 +703,13 @@ class TkRenderer:
         # Get attributes
         name = element.get('name', '')
         
-        # Find selected option if any
-        selected_option = element.find('option', selected=True)
-        if not selected_option:
-            selected_option = element.find('option')  # Get first option
+        # Count options and find the selected one (or the first) in one pass
+        options = element.find_all('option')
+        option_count = len(options)
+        selected_option = next(
+            (option for option in options if option.get('selected') is not None),
+            options[0] if options else None
+        )
         
         # Get display text
         if selected_option:
@@ -714,9 +717,6 @@ class TkRenderer:
         else:
             display_text = name or "Select"
         
-        # Get count of options
-        option_count = len(element.find_all('option'))
-        
         # Render select
         self.content_view.insert(tk.END, f"[Dropdown: {display_text} ▼ ({option_count} options)]")
 
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Behaviour tests for the HTML5 renderer.
+
+Tk is mocked out, so these run without a display: the canvas records the
+items the renderer creates, and fonts measure every character as 7 pixels
+wide with a 15 pixel line height.
+"""
+
+import itertools
+import logging
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from browser_engine.html5_engine.dom import Document
+from browser_engine.html5_engine.rendering.renderer import HTML5Renderer
+
+logging.disable(logging.CRITICAL)
+
+CHAR_WIDTH = 7
+
+TEST_PAGE = """<html><body>
+<h1>Title</h1>
+<p>Some <a href="/x">link text</a> and a paragraph long enough to wrap across
+several lines of the page.</p>
+<div style="border: 2px solid red; background-color: #eee">box</div>
+<ul><li>one</li><li>two</li></ul>
+</body></html>"""
+
+
+class FakeFont:
+    """Stand-in for tkinter.font.Font with fixed-width characters."""
+
+    def __init__(self, *args, **kwargs):
+        self.size = kwargs.get('size', 12)
+
+    def measure(self, text):
+        return CHAR_WIDTH * len(text)
+
+    def metrics(self, key=None):
+        metrics = {'linespace': 15, 'ascent': 12, 'descent': 3}
+        return metrics[key] if key else metrics
+
+    def configure(self, **kwargs):
+        self.size = kwargs.get('size', self.size)
+
+
+class FakeScheduler:
+    """Collects after() callbacks so tests can run them when they choose."""
+
+    def __init__(self):
+        self.jobs = {}
+        self.counter = itertools.count(1)
+
+    def after(self, ms, func, *args):
+        job_id = f'after#{next(self.counter)}'
+        self.jobs[job_id] = (func, args)
+        return job_id
+
+    def after_cancel(self, job_id):
+        self.jobs.pop(job_id, None)
+
+    def run(self):
+        jobs, self.jobs = self.jobs, {}
+        for func, args in jobs.values():
+            func(*args)
+
+
+def make_canvas(created):
+    """
+    Build a mock canvas that records created items.
+
+    Args:
+        created: List that receives (item type, args, options) per item
+
+    Returns:
+        The mock canvas
+    """
+    ids = itertools.count(1)
+    canvas = mock.MagicMock()
+    canvas.winfo_width.return_value = 800
+    canvas.winfo_height.return_value = 600
+    canvas.canvasx.side_effect = lambda value: value
+    canvas.canvasy.side_effect = lambda value: value
+    canvas.bbox.return_value = (0, 0, 100, 20)
+
+    def create(kind):
+        def create_item(*args, **kwargs):
+            created.append((kind, args, kwargs))
+            return next(ids)
+        return create_item
+
+    for kind in ('text', 'rectangle', 'line', 'image', 'polygon', 'oval', 'window'):
+        getattr(canvas, 'create_' + kind).side_effect = create(kind)
+
+    def tcl_call(*args):
+        if args and args[0] == '::wink_create_items':
+            # Arguments after the widget path are (type, coords, options) triples
+            item_ids = []
+            for i in range(2, len(args), 3):
+                created.append((args[i], args[i + 1], args[i + 2]))
+                item_ids.append(str(next(ids)))
+            return tuple(item_ids)
+        return ''
+
+    canvas.tk.call.side_effect = tcl_call
+    canvas.tk.splitlist.side_effect = tuple
+    return canvas
+
+
+class RendererTestCase(unittest.TestCase):
+    """Base class that builds an HTML5Renderer on a mocked Tk."""
+
+    def setUp(self):
+        self.created = []
+        self.scheduler = FakeScheduler()
+        patches = [
+            mock.patch('tkinter.ttk.Frame'),
+            mock.patch('tkinter.ttk.Scrollbar'),
+            mock.patch('tkinter.Canvas', side_effect=lambda *a, **k: make_canvas(self.created)),
+            mock.patch('tkinter.font.Font', FakeFont),
+            mock.patch('browser_engine.html5_engine.js.engine.JSEngine'),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        parent = mock.MagicMock()
+        parent.after.side_effect = self.scheduler.after
+        parent.after_cancel.side_effect = self.scheduler.after_cancel
+        self.renderer = HTML5Renderer(parent)
+
+    def render_page(self, html=TEST_PAGE):
+        document = Document()
+        document.parse_html(html)
+        self.renderer.render(document)
+        return document
+
+
+class TestConstruction(RendererTestCase):
+
+    def test_renderer_builds_with_default_viewport(self):
+        self.assertEqual((self.renderer.viewport_width, self.renderer.viewport_height), (800, 600))
+        self.assertEqual(self.renderer._resize_size, (800, 600))
+        self.assertEqual(self.renderer.canvas_items, [])
+
+    def test_render_draws_page_and_keeps_dom(self):
+        document = self.render_page()
+        self.assertTrue(self.created)
+        self.assertTrue(self.renderer._hit_grid)
+
+        # Laying out the page must not rewrite the DOM
+        body = document.body
+        self.assertEqual([child.tag_name for child in body.children], ['h1', 'p', 'div', 'ul'])
+        link = body.children[1].children[0]
+        self.assertEqual(link.tag_name, 'a')
+        self.assertEqual(link.text_content, 'link text')
+
+
+class TestHitTesting(RendererTestCase):
+
+    def test_topmost_box_wins(self):
+        outer, inner = object(), object()
+        self.renderer._add_hit_rect(0, 0, 300, 300, outer)
+        self.renderer._add_hit_rect(100, 100, 50, 50, inner)
+
+        self.assertIs(self.renderer._find_element_at_position(120, 120), inner)
+        self.assertIs(self.renderer._find_element_at_position(10, 10), outer)
+        self.assertIsNone(self.renderer._find_element_at_position(400, 400))
+
+    def test_box_spanning_grid_cells(self):
+        element = object()
+        size = HTML5Renderer.HIT_GRID_SIZE
+        self.renderer._add_hit_rect(size - 10, size - 10, 2 * size, 20, element)
+
+        for x in (size - 5, size + 5, 2 * size + 50):
+            self.assertIs(self.renderer._find_element_at_position(x, size), element)
+        self.assertIsNone(self.renderer._find_element_at_position(3 * size + 10, size))
+
+    def test_empty_boxes_are_ignored(self):
+        self.renderer._add_hit_rect(0, 0, 0, 50, object())
+        self.assertEqual(self.renderer._hit_grid, {})
+
+    def test_positions_are_unzoomed(self):
+        element = object()
+        self.renderer._add_hit_rect(100, 100, 10, 10, element)
+        self.renderer._applied_zoom = 2.0
+
+        self.assertIs(self.renderer._find_element_at_position(210, 210), element)
+        self.assertIsNone(self.renderer._find_element_at_position(105, 105))
+
+
+class TestLineBreaking(RendererTestCase):
+
+    FONT = ('Arial', 12)
+
+    def break_text(self, text, first_width, max_width):
+        return self.renderer._break_text(self.FONT, text, first_width, max_width)
+
+    def test_words_fill_each_line(self):
+        # 'aaa bbb' is 7 characters wide
+        lines = self.break_text('aaa bbb ccc ddd', 7 * CHAR_WIDTH, 7 * CHAR_WIDTH)
+        self.assertEqual(lines, ['aaa bbb', 'ccc ddd'])
+
+    def test_text_that_fits_is_one_line(self):
+        self.assertEqual(self.break_text('aaa bbb', 100, 100), ['aaa bbb'])
+
+    def test_wraps_before_first_word_of_partly_filled_line(self):
+        lines = self.break_text('aaaa bbbb', 2 * CHAR_WIDTH, 10 * CHAR_WIDTH)
+        self.assertEqual(lines, ['', 'aaaa bbbb'])
+
+    def test_long_word_gets_its_own_line(self):
+        lines = self.break_text('a bbbbbbbbbb c', 4 * CHAR_WIDTH, 4 * CHAR_WIDTH)
+        self.assertEqual(lines, ['a', 'bbbbbbbbbb', 'c'])
+
+    def test_non_ascii_breaks_like_ascii(self):
+        ascii_lines = self.break_text('aaa bbb ccc ddd eee', 8 * CHAR_WIDTH, 11 * CHAR_WIDTH)
+        other_lines = self.break_text('äää bbb ccc ddd eee', 8 * CHAR_WIDTH, 11 * CHAR_WIDTH)
+        self.assertEqual([line.replace('ä', 'a') for line in other_lines], ascii_lines)
+
+    def test_no_width_returns_text(self):
+        self.assertEqual(self.break_text('aaa bbb', 50, 0), ['aaa bbb'])
+
+
+class TestBorders(RendererTestCase):
+
+    def border_box(self, **style):
+        computed = {}
+        for side in ('top', 'right', 'bottom', 'left'):
+            computed[f'border-{side}-width'] = style.get(side, ('2px', 'red'))[0]
+            computed[f'border-{side}-style'] = 'solid'
+            computed[f'border-{side}-color'] = style.get(side, ('2px', 'red'))[1]
+        return SimpleNamespace(element=object(), computed_style=computed)
+
+    def test_uniform_border_is_one_rectangle(self):
+        self.renderer._render_border(self.border_box(), 10, 20, 100, 50)
+
+        self.assertEqual(len(self.renderer._pending_ops), 1)
+        op, coords, opts, _ = self.renderer._pending_ops[0]
+        self.assertEqual(op, 'rectangle')
+        self.assertEqual(coords, (10, 20, 110, 70))
+        self.assertEqual(opts['width'], 2)
+        self.assertEqual(opts['fill'], '')
+
+    def test_mixed_border_is_drawn_per_side(self):
+        self.renderer._render_border(self.border_box(top=('4px', 'blue')), 10, 20, 100, 50)
+
+        ops = self.renderer._pending_ops
+        self.assertEqual([op for op, _, _, _ in ops], ['line'] * 4)
+        self.assertEqual(ops[0][1], (10, 20, 110, 20))
+        self.assertEqual(ops[0][2]['width'], 4)
+
+    def test_connected_sides_merge_into_one_polyline(self):
+        opts = {'width': 1, 'fill': '#000000'}
+        ops = [
+            ('line', (0, 0, 10, 0), opts, 1),
+            ('line', (10, 0, 10, 10), opts, 1),
+            ('line', (10, 10, 0, 10), opts, 1),
+            ('line', (0, 10, 0, 0), opts, 1),
+        ]
+        merged = self.renderer._merge_line_ops(ops)
+
+        self.assertEqual(len(merged), 1)
+        self.assertEqual(merged[0][1], [0, 0, 10, 0, 10, 10, 0, 10, 0, 0])
+
+    def test_repeated_segments_are_dropped(self):
+        opts = {'width': 1, 'fill': '#000000'}
+        ops = [
+            ('line', (0, 0, 10, 0), opts, 1),
+            ('rectangle', (0, 0, 5, 5), {}, 1),
+            ('line', (10, 0, 0, 0), opts, 1),
+        ]
+        merged = self.renderer._merge_line_ops(ops)
+        self.assertEqual([op for op, _, _, _ in merged], ['line', 'rectangle'])
+
+    def test_lines_of_different_elements_are_not_merged(self):
+        opts = {'width': 1, 'fill': '#000000'}
+        ops = [
+            ('line', (0, 0, 10, 0), opts, 1),
+            ('line', (10, 0, 20, 0), opts, 2),
+        ]
+        self.assertEqual(len(self.renderer._merge_line_ops(ops)), 2)
+
+
+class TestRerender(RendererTestCase):
+
+    def test_same_document_reuses_canvas_items(self):
+        document = self.render_page()
+        items = list(self.renderer.canvas_items)
+        created = len(self.created)
+
+        self.renderer.render(document)
+
+        self.assertEqual(len(self.created), created)
+        self.assertEqual(self.renderer.canvas_items, items)
+
+    def test_changed_text_is_redrawn(self):
+        document = self.render_page()
+        document.body.children[0].text_content = 'Other title'
+        del self.created[:]
+
+        self.renderer.render(document)
+
+        texts = [options.get('text') for kind, _, options in self.created if kind == 'text']
+        self.assertIn('Other title', texts)
+
+    def test_changed_style_is_redrawn(self):
+        document = self.render_page()
+        box = document.body.children[2]
+        box.set_attribute('style', 'border: 2px solid blue; background-color: #eee')
+        del self.created[:]
+
+        self.renderer.render(document)
+
+        self.assertTrue(self.created)
+
+    def test_scripts_run_again_on_render_but_not_on_resize(self):
+        document = self.render_page()
+        execute_scripts = self.renderer.js_engine.execute_scripts
+
+        self.renderer.render(document)
+        self.assertEqual(execute_scripts.call_count, 2)
+
+        self.renderer._on_resize(SimpleNamespace(width=700, height=600))
+        self.scheduler.run()
+        self.assertEqual(execute_scripts.call_count, 2)
+
+    def test_resize_renders_once_after_events_settle(self):
+        self.render_page()
+        widths = []
+        render = self.renderer.render
+
+        def counting_render(*args, **kwargs):
+            widths.append(self.renderer.viewport_width)
+            return render(*args, **kwargs)
+
+        self.renderer.render = counting_render
+        for width in range(700, 600, -10):
+            self.renderer._on_resize(SimpleNamespace(width=width, height=500))
+        self.assertEqual(widths, [])
+
+        self.scheduler.run()
+        self.assertEqual(widths, [610])
+
+        # Only the height changed: nothing to re-wrap
+        self.renderer._on_resize(SimpleNamespace(width=610, height=900))
+        self.scheduler.run()
+        self.assertEqual(widths, [610])
+
+    def test_zoom_scales_fonts_and_resets_on_render(self):
+        self.render_page()
+        fonts = list(self.renderer._font_cache.items())
+        self.assertTrue(fonts)
+
+        self.renderer.set_zoom(2.0)
+        for font, tk_font in fonts:
+            self.assertEqual(tk_font.size, font[1] * 2)
+        self.renderer.canvas.scale.assert_called_with('all', 0, 0, 2.0, 2.0)
+
+        self.renderer.zoom_reset()
+        for font, tk_font in fonts:
+            self.assertEqual(tk_font.size, font[1])
+
+
+if __name__ == '__main__':
+    unittest.main()